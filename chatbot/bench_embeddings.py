@@ -0,0 +1,156 @@
+# Compares embedding backends on the chatbot corpus: model load time, document encode
+# throughput, single-query latency, peak RSS and retrieval recall@k against the first
+# configuration (the current full-precision model by default).
+#
+#    python -m chatbot.bench_embeddings
+#    python -m chatbot.bench_embeddings --configs torch onnx onnx-int8 torch:all-MiniLM-L6-v2 --threads 4
+#    python -m chatbot.bench_embeddings --directory ./my_corpus --k 5
+#
+# Each configuration runs in its own process so load time and RSS are not polluted
+# by the models measured before it.
+
+import argparse
+import multiprocessing
+import queue
+import resource
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from chatbot.utils.corpus import CHUNK_SIZE, INVESTOPEDIA_CLASS, INVESTOPEDIA_URLS, OVERLAP, REPLACER, SEPARATOR
+from chatbot.utils.embeddings import MODEL_NAME, SMALL_MODEL_NAME, TORCH, build_embeddings
+from chatbot.utils.ingest_pipeline import clean_text, directory_sources, load_source, url_sources
+
+DEFAULT_CONFIGS = ["torch", "torch-int8", "onnx", "onnx-int8", f"torch:{SMALL_MODEL_NAME}"]
+QUERIES = [
+    "What is an options contract?",
+    "How does a covered call generate income?",
+    "When should I buy a married put?",
+    "What does delta measure?",
+    "How does theta decay affect option prices?",
+    "What is vega and why does it matter?",
+    "Explain gamma risk near expiration.",
+    "What is a vertical spread?",
+    "How do I set up an iron condor?",
+    "What are LEAPS options?",
+    "Why sell puts in a sideways market?",
+    "How does a calendar spread make money?",
+    "Which options strategies work for beginners?",
+    "Can options beat the market?",
+    "What does open interest tell me?",
+    "How is implied volatility different from historical volatility?",
+    "What is the maximum loss on a bull call spread?",
+    "How do dividends affect call options?",
+    "What happens when an option expires in the money?",
+    "How do I hedge a stock position with options?",
+]
+
+
+def load_corpus(directory: str = "") -> List[str]:
+    sources = directory_sources(directory) if directory else url_sources(INVESTOPEDIA_URLS)
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=CHUNK_SIZE, chunk_overlap=OVERLAP, length_function=len, is_separator_regex=False
+    )
+    chunks: List[str] = []
+    for source in sources:
+        content = clean_text(load_source(source, INVESTOPEDIA_CLASS if not directory else None, SEPARATOR), REPLACER)
+        chunks.extend(splitter.split_text(content))
+    return chunks
+
+
+def parse_config(config: str) -> Dict[str, str]:
+    backend, _, model_name = config.partition(":")
+    if model_name and "/" not in model_name:
+        model_name = f"sentence-transformers/{model_name}"
+    return {"backend": backend, "model_name": model_name or MODEL_NAME}
+
+
+def measure(config: str, chunks: List[str], threads: int, k: int, results) -> None:
+    """Runs in a child process and sends one configuration's metrics back through `results`."""
+    try:
+        start = time.perf_counter()
+        embeddings = build_embeddings(threads=threads, **parse_config(config))
+        load_seconds = time.perf_counter() - start
+
+        embeddings.embed_query("warm up")
+        start = time.perf_counter()
+        doc_vectors = np.asarray(embeddings.embed_documents(chunks), dtype=np.float32)
+        encode_seconds = time.perf_counter() - start
+
+        query_vectors = []
+        latencies = []
+        for query in QUERIES:
+            start = time.perf_counter()
+            query_vectors.append(embeddings.embed_query(query))
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        doc_vectors /= np.linalg.norm(doc_vectors, axis=1, keepdims=True)
+        query_matrix = np.asarray(query_vectors, dtype=np.float32)
+        query_matrix /= np.linalg.norm(query_matrix, axis=1, keepdims=True)
+        top_k = np.argsort(-(query_matrix @ doc_vectors.T), axis=1)[:, :k]
+
+        results.put(
+            {
+                "config": config,
+                "load_s": load_seconds,
+                "docs_per_s": len(chunks) / encode_seconds,
+                "query_p50_ms": statistics.median(latencies),
+                "query_p95_ms": float(np.percentile(latencies, 95)),
+                # ru_maxrss is KiB on Linux and bytes on macOS.
+                "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                / (1024 * 1024 if sys.platform == "darwin" else 1024),
+                "top_k": top_k.tolist(),
+            }
+        )
+    except Exception as exc:
+        results.put({"config": config, "error": str(exc)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding backends on the chatbot corpus.")
+    parser.add_argument("--configs", nargs="+", default=DEFAULT_CONFIGS, help="backend[:model] entries")
+    parser.add_argument("--threads", type=int, default=0, help="inference threads (0 = library default)")
+    parser.add_argument("--k", type=int, default=3, help="k for recall@k (the chatbot retrieves 3)")
+    parser.add_argument("--directory", default="", help="benchmark on local files instead of the Investopedia pages")
+    args = parser.parse_args()
+
+    chunks = load_corpus(args.directory)
+    print(f"Corpus: {len(chunks)} chunks, {len(QUERIES)} queries, baseline {args.configs[0]}")
+    if not args.configs[0].startswith(TORCH):
+        print("Note: recall is measured against the first configuration, which is not the torch baseline.")
+
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for config in args.configs:
+        results = context.Queue()
+        process = context.Process(target=measure, args=(config, chunks, args.threads, args.k, results))
+        process.start()
+        # The results are a few small lists, so joining before reading cannot fill the pipe.
+        process.join()
+        try:
+            rows.append(results.get(timeout=5))
+        except queue.Empty:
+            rows.append({"config": config, "error": f"benchmark process exited with code {process.exitcode}"})
+
+    baseline = next((row["top_k"] for row in rows if "top_k" in row), None)
+    print(
+        f"\n{'config':<44} {'load s':>7} {'docs/s':>8} {'q p50 ms':>9} {'q p95 ms':>9} {'RSS MB':>8} "
+        f"{'recall@' + str(args.k):>9}"
+    )
+    for row in rows:
+        if "error" in row:
+            print(f"{row['config']:<44} failed: {row['error']}")
+            continue
+        recall = np.mean([len(set(ours) & set(theirs)) / args.k for ours, theirs in zip(row["top_k"], baseline)])
+        print(
+            f"{row['config']:<44} {row['load_s']:>7.1f} {row['docs_per_s']:>8.1f} {row['query_p50_ms']:>9.1f} "
+            f"{row['query_p95_ms']:>9.1f} {row['peak_rss_mb']:>8.0f} {recall:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
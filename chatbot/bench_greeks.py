@@ -0,0 +1,133 @@
+# Benchmarks the vectorized Black-Scholes engine on large option chains against a
+# per-contract loop. Correctness (published reference values, the implied volatility
+# round trip, the tool's units) is asserted in tests/test_black_scholes.py.
+#
+#    python -m chatbot.bench_greeks
+#    python -m chatbot.bench_greeks --strikes 400 --expiries 50 --repeat 5
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from chatbot.utils.black_scholes import greeks, implied_volatility
+from chatbot.utils.tool_calls.option_greeks import get_option_greeks
+
+
+def norm_cdf(x: float) -> float:
+    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+
+
+def scalar_greeks(spot, strike, expiry, volatility, rate, is_call):
+    """One contract at a time, the way it would be written without NumPy."""
+    sqrt_t = math.sqrt(expiry)
+    d1 = (math.log(spot / strike) + (rate + 0.5 * volatility**2) * expiry) / (volatility * sqrt_t)
+    d2 = d1 - volatility * sqrt_t
+    sign = 1 if is_call else -1
+    discounted_strike = strike * math.exp(-rate * expiry)
+    density = math.exp(-0.5 * d1 * d1) / math.sqrt(2 * math.pi)
+    price = sign * (spot * norm_cdf(sign * d1) - discounted_strike * norm_cdf(sign * d2))
+    delta = sign * norm_cdf(sign * d1)
+    gamma = density / (spot * volatility * sqrt_t)
+    vega = spot * density * sqrt_t
+    theta = -spot * density * volatility / (2 * sqrt_t) - sign * rate * discounted_strike * norm_cdf(sign * d2)
+    rho = sign * expiry * discounted_strike * norm_cdf(sign * d2)
+    return price, delta, gamma, theta, vega, rho
+
+
+def scalar_implied_volatility(price, spot, strike, expiry, rate, is_call):
+    low, high = 1e-4, 5.0
+    for _ in range(100):
+        volatility = 0.5 * (low + high)
+        if scalar_greeks(spot, strike, expiry, volatility, rate, is_call)[0] > price:
+            high = volatility
+        else:
+            low = volatility
+    return volatility
+
+
+def build_chain(n_strikes: int, n_expiries: int, spot: float = 100.0, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    strike, expiry = np.meshgrid(np.linspace(0.5 * spot, 1.5 * spot, n_strikes), np.linspace(7, 730, n_expiries) / 365)
+    strike, expiry = strike.ravel(), expiry.ravel()
+    is_call = np.arange(strike.size) % 2 == 0
+    # A smile: out-of-the-money strikes get more volatility, plus noise.
+    volatility = 0.2 + 0.3 * np.log(strike / spot) ** 2 + rng.uniform(-0.02, 0.02, strike.size)
+    return spot, strike, expiry, volatility, is_call
+
+
+def best_of(repeat: int, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized Black-Scholes engine.")
+    parser.add_argument("--strikes", type=int, default=250)
+    parser.add_argument("--expiries", type=int, default=48)
+    parser.add_argument("--rate", type=float, default=0.045)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    spot, strike, expiry, volatility, is_call = build_chain(args.strikes, args.expiries)
+    rate = args.rate
+    print(f"Chain: {strike.size} contracts ({args.strikes} strikes x {args.expiries} expiries)")
+
+    vector_seconds, vector = best_of(args.repeat, lambda: greeks(spot, strike, expiry, volatility, rate, 0.0, is_call))
+    contracts = list(zip(strike.tolist(), expiry.tolist(), volatility.tolist(), is_call.tolist()))
+    loop_seconds, loop = best_of(1, lambda: [scalar_greeks(spot, k, t, v, rate, c) for k, t, v, c in contracts])
+    greeks_error = np.max(np.abs(np.asarray(vector).T - np.asarray(loop)))
+
+    prices = vector.price
+    iv_seconds, recovered = best_of(
+        args.repeat, lambda: implied_volatility(prices, spot, strike, expiry, rate, 0.0, is_call)
+    )
+    # The bisection loop is slow, so it only runs on a sample and the time is scaled up.
+    sample = np.linspace(0, strike.size - 1, min(strike.size, 500)).astype(int)
+    start = time.perf_counter()
+    for i in sample:
+        scalar_implied_volatility(prices[i], spot, strike[i], expiry[i], rate, is_call[i])
+    iv_loop_seconds = (time.perf_counter() - start) * strike.size / sample.size
+    # Deep in-the-money prices carry almost no time value, so volatility is only
+    # identifiable for contracts with a meaningful vega.
+    identifiable = vector.vega > 1e-3 * spot
+    iv_error = np.nanmax(np.abs(recovered[identifiable] - volatility[identifiable]))
+    unsolved = int(np.isnan(recovered[identifiable]).sum())
+
+    parity = (
+        greeks(spot, strike, expiry, volatility, rate, 0.0, True).price
+        - greeks(spot, strike, expiry, volatility, rate, 0.0, False).price
+        - (spot - strike * np.exp(-rate * expiry))
+    )
+
+    print(f"{'case':<26} {'loop ms':>10} {'vectorized ms':>14} {'speedup':>8}  max abs error")
+    print(
+        f"{'price + 5 Greeks':<26} {loop_seconds * 1000:>10.1f} {vector_seconds * 1000:>14.1f} "
+        f"{loop_seconds / vector_seconds:>7.0f}x  {greeks_error:.2e}"
+    )
+    print(
+        f"{'implied volatility':<26} {iv_loop_seconds * 1000:>10.1f} {iv_seconds * 1000:>14.1f} "
+        f"{iv_loop_seconds / iv_seconds:>7.0f}x  {iv_error:.2e} ({unsolved} unsolved)"
+    )
+    print(f"Put-call parity max error: {np.max(np.abs(parity)):.2e}")
+
+    start = time.perf_counter()
+    get_option_greeks.invoke(
+        {
+            "spot": spot,
+            "strikes": np.unique(strike).tolist(),
+            "days_to_expiry": (np.unique(expiry) * 365).tolist(),
+            "volatility": 0.25,
+            "option_type": "both",
+        }
+    )
+    print(f"Tool call for {2 * strike.size} contracts incl. JSON: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
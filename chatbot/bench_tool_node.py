@@ -0,0 +1,113 @@
+# Times the chatbot's tools node with deliberately slow, hung and failing stub
+# tools, comparing ParallelToolNode with running the same calls one after another
+# and with LangGraph's ToolNode, on both the sync and the async path.
+# The behaviour itself is asserted in tests/test_tool_node.py.
+#
+#    python -m chatbot.bench_tool_node
+#    python -m chatbot.bench_tool_node --calls 6 --delay 0.5 --timeout 1.5
+#
+# Nothing here needs the network, Ollama or the vector store.
+
+import argparse
+import asyncio
+import json
+import time
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.prebuilt import ToolNode
+
+from chatbot.utils.tool_node import ParallelToolNode
+
+DELAY_SECONDS = 0.5
+# Long enough to be well past any timeout tried here; the process waits for it on exit.
+HANG_SECONDS = 5.0
+
+
+def make_slow_quote(delay: float):
+    @tool
+    def slow_quote(ticker: str) -> str:
+        """Stub of a quote lookup that takes a fixed delay.
+
+        Args:
+            ticker (str): the ticker of a stock
+        """
+        time.sleep(delay)
+        return json.dumps({"ticker": ticker, "lastPrice": 100.0})
+
+    return slow_quote
+
+
+@tool
+def hung_quote(ticker: str) -> str:
+    """Stub of an upstream call that never answers in time.
+
+    Args:
+        ticker (str): the ticker of a stock
+    """
+    time.sleep(HANG_SECONDS)
+    return ""
+
+
+@tool
+def broken_quote(ticker: str) -> str:
+    """Stub of an upstream call that fails.
+
+    Args:
+        ticker (str): the ticker of a stock
+    """
+    raise ConnectionError(f"upstream refused {ticker}")
+
+
+def tool_calls_state(names):
+    calls = [{"name": name, "args": {"ticker": f"T{i}"}, "id": f"call_{i}"} for i, name in enumerate(names)]
+    return {"messages": [AIMessage(content="", tool_calls=calls)]}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def statuses(result):
+    return [json.loads(m.content).get("error") if m.status == "error" else "ok" for m in result["messages"]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the parallel tools node with slow stub tools.")
+    parser.add_argument("--calls", type=int, default=4, help="slow tool calls in one AI message")
+    parser.add_argument("--delay", type=float, default=DELAY_SECONDS, help="seconds each slow call takes")
+    parser.add_argument("--timeout", type=float, default=1.5, help="per-call timeout of the node")
+    args = parser.parse_args()
+
+    slow_quote = make_slow_quote(args.delay)
+    tools = [slow_quote, hung_quote, broken_quote]
+    node = ParallelToolNode(tools, max_workers=args.calls + 2, timeout=args.timeout)
+    slow_state = tool_calls_state(["slow_quote"] * args.calls)
+    mixed_state = tool_calls_state(["slow_quote", "hung_quote", "broken_quote", "no_such_tool"])
+
+    sequential_seconds, _ = timed(lambda: [slow_quote.invoke(c["args"]) for c in slow_state["messages"][0].tool_calls])
+    parallel_seconds, parallel = timed(node.invoke, slow_state)
+    async_seconds, async_result = timed(lambda: asyncio.run(node.ainvoke(slow_state)))
+    mixed_seconds, mixed = timed(node.invoke, mixed_state)
+    async_mixed_seconds, async_mixed = timed(lambda: asyncio.run(node.ainvoke(mixed_state)))
+
+    print(f"{args.calls} calls of {args.delay}s each, timeout {args.timeout}s")
+    print(f"{'case':<40} {'seconds':>8}  results")
+    print(f"{'sequential':<40} {sequential_seconds:>8.2f}")
+    print(f"{'ParallelToolNode.invoke':<40} {parallel_seconds:>8.2f}  {statuses(parallel)}")
+    print(f"{'ParallelToolNode.ainvoke':<40} {async_seconds:>8.2f}  {statuses(async_result)}")
+    print(f"{'mixed (slow, hung, broken, unknown)':<40} {mixed_seconds:>8.2f}  {statuses(mixed)}")
+    print(f"{'mixed, async':<40} {async_mixed_seconds:>8.2f}  {statuses(async_mixed)}")
+
+    # LangGraph's ToolNode has no timeout, so the hung call holds up the whole step.
+    baseline_seconds, _ = timed(ToolNode(tools).invoke, mixed_state)
+    print(f"\nLangGraph ToolNode on the mixed calls: {baseline_seconds:.2f}s")
+
+    print("\nPer-tool latency")
+    print(node.latency_report())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,17 @@ from dotenv import load_dotenv
 import os
 
 os.environ["USER_AGENT"] = "custom_agent"
+# Loaded before the app modules so settings such as EMBEDDINGS_BACKEND apply at import time.
+load_dotenv()
 
 
-from utils.gradio_setup import demo
-
-
-load_dotenv()
+from utils.gradio_setup import CHAT_CONCURRENCY, CHAT_QUEUE_SIZE, demo  # noqa: E402
+from utils.news_ingest import NEWS_INGESTOR  # noqa: E402
 
 
 if __name__ == "__main__":
-    demo.queue().launch(share=True)
+    # Point NEWS_DB_PATH at the web_scraper poller's SQLite file to stream new headlines into the index.
+    news_db_path = os.getenv("NEWS_DB_PATH")
+    if news_db_path:
+        NEWS_INGESTOR.follow_store(news_db_path)
+    demo.queue(default_concurrency_limit=CHAT_CONCURRENCY, max_size=CHAT_QUEUE_SIZE).launch(share=True)
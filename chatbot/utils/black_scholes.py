@@ -0,0 +1,153 @@
+from typing import NamedTuple
+
+import numpy as np
+from scipy.special import ndtr
+
+# Implied volatility is searched for inside this bracket (annualized, 0.01% to 500%).
+MIN_VOLATILITY: float = 1e-4
+MAX_VOLATILITY: float = 5.0
+IV_PRICE_TOLERANCE: float = 1e-8
+IV_MAX_ITERATIONS: int = 100
+
+SQRT_2PI: float = np.sqrt(2 * np.pi)
+
+
+class Greeks(NamedTuple):
+    """
+    Black-Scholes-Merton values, one array entry per contract.
+
+    Textbook units: theta per year, vega and rho per 1.00 (100 percentage points)
+    change in volatility and rate.
+    """
+
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    rho: np.ndarray
+
+
+def _as_arrays(*values):
+    return np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in values))
+
+
+def _sign(is_call) -> np.ndarray:
+    return np.where(np.asarray(is_call, dtype=bool), 1.0, -1.0)
+
+
+def greeks(spot, strike, expiry, volatility, rate=0.0, dividend=0.0, is_call=True) -> Greeks:
+    """
+    Prices European options and their Greeks in one vectorized pass.
+
+    Every argument may be a scalar or an array; they are broadcast against each
+    other, so a whole chain is priced by passing arrays of strikes and expiries
+    (in years). Contracts with a non-positive expiry or volatility come back as NaN.
+    """
+    spot, strike, expiry, volatility, rate, dividend = _as_arrays(spot, strike, expiry, volatility, rate, dividend)
+    sign = np.broadcast_to(_sign(is_call), spot.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_t = np.sqrt(np.where(expiry > 0, expiry, np.nan))
+        vol_sqrt_t = np.where(volatility > 0, volatility, np.nan) * sqrt_t
+        d1 = (np.log(spot / strike) + (rate - dividend + 0.5 * volatility**2) * expiry) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+
+        discounted_spot = spot * np.exp(-dividend * expiry)
+        discounted_strike = strike * np.exp(-rate * expiry)
+        n_d1 = ndtr(sign * d1)
+        n_d2 = ndtr(sign * d2)
+        density = np.exp(-0.5 * d1 * d1) / SQRT_2PI
+
+        price = sign * (discounted_spot * n_d1 - discounted_strike * n_d2)
+        delta = sign * np.exp(-dividend * expiry) * n_d1
+        gamma = discounted_spot * density / (spot * spot * vol_sqrt_t)
+        vega = discounted_spot * density * sqrt_t
+        theta = (
+            -discounted_spot * density * volatility / (2 * sqrt_t)
+            - sign * rate * discounted_strike * n_d2
+            + sign * dividend * discounted_spot * n_d1
+        )
+        rho = sign * expiry * discounted_strike * n_d2
+    return Greeks(price, delta, gamma, theta, vega, rho)
+
+
+def _price_and_vega(spot, strike, expiry, volatility, rate, dividend, sign):
+    sqrt_t = np.sqrt(expiry)
+    vol_sqrt_t = volatility * sqrt_t
+    d1 = (np.log(spot / strike) + (rate - dividend + 0.5 * volatility**2) * expiry) / vol_sqrt_t
+    discounted_spot = spot * np.exp(-dividend * expiry)
+    discounted_strike = strike * np.exp(-rate * expiry)
+    price = sign * (discounted_spot * ndtr(sign * d1) - discounted_strike * ndtr(sign * (d1 - vol_sqrt_t)))
+    vega = discounted_spot * np.exp(-0.5 * d1 * d1) / SQRT_2PI * sqrt_t
+    return price, vega
+
+
+def implied_volatility(
+    price,
+    spot,
+    strike,
+    expiry,
+    rate=0.0,
+    dividend=0.0,
+    is_call=True,
+    tolerance: float = IV_PRICE_TOLERANCE,
+    max_iterations: int = IV_MAX_ITERATIONS,
+) -> np.ndarray:
+    """
+    Solves for the volatility that reproduces each `price`, for a whole chain at once.
+
+    Newton steps are taken on every unsolved contract together; a contract whose step
+    would leave its current [low, high] bracket bisects instead (the safeguard Brent's
+    method relies on), so deep in- or out-of-the-money contracts with tiny vega still
+    converge. Prices outside the no-arbitrage bounds have no solution and return NaN.
+    """
+    price, spot, strike, expiry, rate, dividend = _as_arrays(price, spot, strike, expiry, rate, dividend)
+    sign = np.broadcast_to(_sign(is_call), price.shape).astype(np.float64)
+    shape = price.shape
+    price, spot, strike, expiry, rate, dividend, sign = (
+        array.ravel() for array in (price, spot, strike, expiry, rate, dividend, sign)
+    )
+    result = np.full(price.size, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        discounted_spot = spot * np.exp(-dividend * expiry)
+        discounted_strike = strike * np.exp(-rate * expiry)
+        lower_bound = np.maximum(sign * (discounted_spot - discounted_strike), 0.0)
+        upper_bound = np.where(sign > 0, discounted_spot, discounted_strike)
+        solvable = (expiry > 0) & (spot > 0) & (strike > 0) & (price > lower_bound) & (price < upper_bound)
+
+        # Start at the inflection point of price in volatility (Manaster-Koehler), where
+        # Newton is monotone, falling back to the at-the-money approximation near the money.
+        moneyness = np.abs(np.log(discounted_spot / discounted_strike))
+        start = np.maximum(np.sqrt(2 * moneyness / expiry), np.sqrt(2 * np.pi / expiry) * price / spot)
+
+    index = np.flatnonzero(solvable)
+    args = [array[index] for array in (spot, strike, expiry, rate, dividend, sign)]
+    target = price[index]
+    volatility = np.clip(start[index], MIN_VOLATILITY, MAX_VOLATILITY)
+    low = np.full(index.size, MIN_VOLATILITY)
+    high = np.full(index.size, MAX_VOLATILITY)
+
+    for _ in range(max_iterations):
+        if index.size == 0:
+            break
+        model_price, vega = _price_and_vega(args[0], args[1], args[2], volatility, args[3], args[4], args[5])
+        error = model_price - target
+        converged = (np.abs(error) <= tolerance * np.maximum(target, 1.0)) | (high - low <= tolerance)
+        result[index[converged]] = volatility[converged]
+
+        active = ~converged
+        index, target, volatility, low, high, error, vega = (
+            array[active] for array in (index, target, volatility, low, high, error, vega)
+        )
+        args = [array[active] for array in args]
+
+        # Price rises with volatility, so the sign of the error tells which side the root is on.
+        high = np.where(error > 0, volatility, high)
+        low = np.where(error < 0, volatility, low)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = volatility - error / vega
+        volatility = np.where((newton > low) & (newton < high), newton, 0.5 * (low + high))
+
+    return result.reshape(shape)
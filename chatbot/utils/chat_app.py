@@ -1,22 +1,46 @@
+import re
 from typing import Dict
 from langsmith import traceable
 from langgraph.graph import START, StateGraph, END
 from langchain_core.messages import AIMessage, HumanMessage
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import ToolNode
+from langchain_core.runnables import RunnableLambda
 
 from chatbot.utils.message_config import State
 from chatbot.utils.llama_model import model, trimmer, tools
 from chatbot.utils.message_config import prompt_template
-from chatbot.utils.document_helper import query_relevant_text
+from chatbot.utils.document_helper import aquery_relevant_text, query_relevant_text
+from chatbot.utils.tool_node import ParallelToolNode
+from chatbot.utils.session_memory import BoundedMemorySaver
 
 LANGUAGE: str = "English"
-CONFIG: Dict[str, Dict[str, str]] = {"configurable": {"thread_id": "options-trading-chat"}}
+DEFAULT_THREAD_ID: str = "options-trading-chat"
+CONFIG: Dict[str, Dict[str, str]] = {"configurable": {"thread_id": DEFAULT_THREAD_ID}}
 TOP_N = 3
+# Questions that may need a tool; otherwise tool calls are sent back to the model.
+TOOL_KEYWORDS = (
+    "ticker",
+    "tickers",
+    "stock",
+    "stocks",
+    "greek",
+    "greeks",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "implied vol",
+    "implied volatility",
+    "strike",
+    "strikes",
+)
+# Matched as whole words, so "rho" doesn't fire on "Rhode Island" nor "vega" on "Vegas".
+TOOL_KEYWORD_PATTERN = re.compile(r"\b(?:" + "|".join(map(re.escape, TOOL_KEYWORDS)) + r")\b")
 
 workflow = StateGraph(state_schema=State)
 
-tool_node = ToolNode(tools)
+# Runs the model's tool calls concurrently, each with a timeout (TOOL_WORKERS / TOOL_TIMEOUT_SECONDS).
+tool_node = ParallelToolNode(tools)
 
 
 def retrieve(state: State):
@@ -24,6 +48,11 @@ def retrieve(state: State):
     return {"context": retrieved_docs}
 
 
+async def aretrieve(state: State):
+    retrieved_docs = await aquery_relevant_text(query=state["question"], top_n=TOP_N)
+    return {"context": retrieved_docs}
+
+
 def call_model(state: State):
     trimmed_messages = trimmer.invoke(state["messages"])
     docs_content = "".join(doc.page_content for doc in state["context"])
@@ -34,27 +63,40 @@ def call_model(state: State):
     return {"messages": [response]}
 
 
+async def acall_model(state: State):
+    trimmed_messages = await trimmer.ainvoke(state["messages"])
+    docs_content = "".join(doc.page_content for doc in state["context"])
+    prompt = await prompt_template.ainvoke(
+        {"messages": trimmed_messages, "context": docs_content, "question": state["question"]}
+    )
+    # Awaits Ollama over its async client, so the event loop keeps serving other sessions.
+    response = await model.ainvoke(prompt)
+    return {"messages": [response]}
+
+
 def should_continue(state: State):
     last_message = state["messages"][-1]
-    question = state["question"]
+    question = state["question"].lower()
     if last_message.tool_calls:
-        if "ticker" in question or "stock" in question:
+        if TOOL_KEYWORD_PATTERN.search(question):
             return "tools"
         return "llm"
     return END
 
 
 # workflow.add_sequence([retrieve, call_model])
-workflow.add_node("llm", call_model)
-workflow.add_node("tools", tool_node)
-workflow.add_node("retrieve", retrieve)
+# Each node has a sync and an async body: app.invoke runs the first, app.ainvoke the second.
+workflow.add_node("llm", RunnableLambda(call_model, acall_model))
+workflow.add_node("tools", RunnableLambda(tool_node.invoke, tool_node.ainvoke))
+workflow.add_node("retrieve", RunnableLambda(retrieve, aretrieve))
 
 workflow.add_edge(START, "retrieve")
 workflow.add_edge("retrieve", "llm")
 workflow.add_conditional_edges("llm", should_continue, ["tools", END, "llm"])
 workflow.add_edge("tools", "llm")
 
-memory = MemorySaver()
+# One thread per browser session; the least recently used are dropped past CHAT_MAX_SESSIONS.
+memory = BoundedMemorySaver()
 app = workflow.compile(checkpointer=memory)
 
 
@@ -64,3 +106,13 @@ def chat(input_text: str):
     output_message = app.invoke({"messages": input_messages, "question": input_text}, CONFIG)["messages"][-1]
     if isinstance(output_message, AIMessage):
         return output_message.content
+
+
+@traceable(run_type="chain", name="ollama chat bot", project_name="chatbot for options")
+async def achat(input_text: str, thread_id: str = DEFAULT_THREAD_ID):
+    """Async `chat`; `thread_id` keeps each session's history separate in the checkpointer."""
+    input_messages = [HumanMessage(input_text)]
+    config = {"configurable": {"thread_id": thread_id}}
+    output_message = (await app.ainvoke({"messages": input_messages, "question": input_text}, config))["messages"][-1]
+    if isinstance(output_message, AIMessage):
+        return output_message.content
@@ -0,0 +1,25 @@
+import os
+from typing import List
+
+INVESTOPEDIA_URLS: List[str] = [
+    "https://www.investopedia.com/terms/o/optionscontract.asp",
+    "https://www.investopedia.com/terms/c/coveredcall.asp",
+    "https://www.investopedia.com/terms/m/marriedput.asp",
+    "https://www.investopedia.com/trading/getting-to-know-the-greeks/",
+    "https://www.investopedia.com/terms/v/verticalspread.asp",
+    "https://www.investopedia.com/terms/i/ironcondor.asp",
+    "https://www.investopedia.com/terms/l/leaps.asp",
+    "https://www.investopedia.com/articles/optioninvestor/10/sell-puts-benefit-any-market.asp",
+    "https://www.investopedia.com/terms/c/calendarspread.asp",
+    "https://www.investopedia.com/trading/options-strategies/",
+    "https://www.investopedia.com/articles/optioninvestor/07/options_beat_market.asp",
+    "https://www.investopedia.com/trading/options-trading-volume-and-open-interest/",
+    "https://www.investopedia.com/terms/v/volatility.asp",
+]
+INVESTOPEDIA_CLASS = "loc article-content"
+SEPARATOR = " "
+REPLACER = ["\xa0"]
+CHUNK_SIZE = 500
+OVERLAP = 0
+# Index saved pages or notes from this directory instead of fetching the URLs (offline runs, load tests).
+CORPUS_DIRECTORY: str = os.getenv("CORPUS_DIRECTORY", "")
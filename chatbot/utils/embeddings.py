@@ -0,0 +1,121 @@
+import os
+import platform
+from typing import Any, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+from langchain_huggingface import HuggingFaceEmbeddings
+
+MODEL_NAME: str = "sentence-transformers/all-mpnet-base-v2"
+SMALL_MODEL_NAME: str = "sentence-transformers/all-MiniLM-L6-v2"
+# Dynamically int8-quantized exports published alongside the sentence-transformers ONNX models, one per
+# instruction set. Any of them loads anywhere, but the signed-int8 ones can saturate on x86 CPUs without VNNI
+# (onnxruntime's u8s8 kernels), which AVX2 CPUs lack, so the default follows the CPU; see default_onnx_int8_file.
+ONNX_INT8_FILES = {
+    "avx512_vnni": "onnx/model_qint8_avx512_vnni.onnx",
+    "avx512f": "onnx/model_qint8_avx512.onnx",
+    "avx2": "onnx/model_quint8_avx2.onnx",
+}
+ONNX_ARM64_INT8_FILE: str = "onnx/model_qint8_arm64.onnx"
+
+TORCH: str = "torch"
+TORCH_INT8: str = "torch-int8"
+ONNX: str = "onnx"
+ONNX_INT8: str = "onnx-int8"
+BACKENDS = (TORCH, TORCH_INT8, ONNX, ONNX_INT8)
+
+
+def default_onnx_int8_file() -> str:
+    """
+    The int8 ONNX export for this CPU: the ARM64 one, or the one for the widest x86 instruction set
+    listed in /proc/cpuinfo. Where the flags can't be read, AVX2 (every x86-64 CPU since 2013).
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return ONNX_ARM64_INT8_FILE
+    try:
+        with open("/proc/cpuinfo") as f:
+            flags = set(f.read().split())
+    except OSError:
+        flags = set()
+    return next((file_name for flag, file_name in ONNX_INT8_FILES.items() if flag in flags), ONNX_INT8_FILES["avx2"])
+
+
+ONNX_INT8_FILE: str = default_onnx_int8_file()
+
+EMBEDDINGS_BACKEND: str = os.getenv("EMBEDDINGS_BACKEND", TORCH)
+EMBEDDINGS_MODEL_NAME: str = os.getenv("EMBEDDINGS_MODEL_NAME", MODEL_NAME)
+# 0 keeps the library default (usually one thread per physical core).
+EMBEDDINGS_THREADS: int = int(os.getenv("EMBEDDINGS_THREADS", "0"))
+EMBEDDINGS_ONNX_FILE: str = os.getenv("EMBEDDINGS_ONNX_FILE", ONNX_INT8_FILE)
+
+
+class SentenceTransformerEmbeddings(Embeddings):
+    """LangChain embeddings over a SentenceTransformer that was loaded with a non-default backend."""
+
+    def __init__(self, model: Any, batch_size: int = 32):
+        self.model = model
+        self.batch_size = batch_size
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        texts = [text.replace("\n", " ") for text in texts]
+        return self.model.encode(texts, batch_size=self.batch_size, convert_to_numpy=True).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+def _onnx_model_kwargs(threads: int, file_name: Optional[str]) -> Dict[str, Any]:
+    model_kwargs: Dict[str, Any] = {"provider": "CPUExecutionProvider"}
+    if file_name:
+        # Without this a missing file is not an error: sentence-transformers exports the full-precision model instead.
+        model_kwargs["file_name"] = file_name
+        model_kwargs["export"] = False
+    if threads:
+        import onnxruntime
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = threads
+        model_kwargs["session_options"] = session_options
+    return model_kwargs
+
+
+def build_embeddings(
+    backend: str = EMBEDDINGS_BACKEND,
+    model_name: str = EMBEDDINGS_MODEL_NAME,
+    threads: int = EMBEDDINGS_THREADS,
+    onnx_file: str = EMBEDDINGS_ONNX_FILE,
+) -> Embeddings:
+    """
+    Builds the embedding model for `backend`:
+
+    - torch: full-precision PyTorch, the original setup.
+    - torch-int8: PyTorch with every Linear layer dynamically quantized to int8.
+    - onnx: the model's ONNX export run by onnxruntime (needs optimum[onnxruntime]).
+    - onnx-int8: the int8-quantized ONNX export in `onnx_file`, by default the one matching this CPU.
+
+    A smaller model is chosen independently through `model_name`, e.g. SMALL_MODEL_NAME.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown embeddings backend {backend!r}, expected one of {', '.join(BACKENDS)}.")
+
+    if backend in (TORCH, TORCH_INT8) and threads:
+        import torch
+
+        torch.set_num_threads(threads)
+
+    if backend == TORCH:
+        return HuggingFaceEmbeddings(model_name=model_name)
+
+    from sentence_transformers import SentenceTransformer
+
+    if backend == TORCH_INT8:
+        import torch
+
+        model = SentenceTransformer(model_name, device="cpu")
+        torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        return SentenceTransformerEmbeddings(model)
+
+    file_name = onnx_file if backend == ONNX_INT8 else None
+    model = SentenceTransformer(
+        model_name, device="cpu", backend="onnx", model_kwargs=_onnx_model_kwargs(threads, file_name)
+    )
+    return SentenceTransformerEmbeddings(model)
@@ -1,6 +1,15 @@
+import os
+
 import gradio as gr
 
-from chatbot.utils.chat_app import chat
+from chatbot.utils.chat_app import achat
+
+# Chats generated at once; match it to what the Ollama server runs in parallel (its OLLAMA_NUM_PARALLEL).
+CHAT_CONCURRENCY: int = int(os.getenv("CHAT_CONCURRENCY", os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+# Requests allowed to wait beyond that; further users are told the queue is full instead of hanging.
+# The queue bounds requests, not conversations: each session's history is kept by the chat app's
+# checkpointer, for the CHAT_MAX_SESSIONS most recently active sessions (see session_memory.py).
+CHAT_QUEUE_SIZE: int = int(os.getenv("CHAT_QUEUE_SIZE", "32"))
 
 HEADER_HTML: str = "<h1 style='color: #282c34; font-family: Arial;'>Welcome to your basic options trading AI advisor!"
 
@@ -29,6 +38,11 @@ border-color: #61dafb;
 """
 
 
+async def respond(input_text: str, request: gr.Request):
+    # One conversation per browser session rather than one shared by every user.
+    return await achat(input_text, thread_id=request.session_hash)
+
+
 with gr.Blocks(css=CSS) as demo:
     gr.HTML(HEADER_HTML)
     with gr.Row():
@@ -37,5 +51,13 @@ with gr.Blocks(css=CSS) as demo:
         submit_btn = gr.Button("Submit")
     output_box = gr.Textbox(label="Options AI bot response.", elem_id="model_output")
 
-    submit_btn.click(fn=chat, inputs=input_box, outputs=output_box)
-    clear_btn.click(fn=lambda: "", inputs=None, outputs=input_box)
+    # Waiting requests see their queue position and an ETA over the response box.
+    submit_btn.click(
+        fn=respond,
+        inputs=input_box,
+        outputs=output_box,
+        concurrency_limit="default",
+        concurrency_id="chat",
+        show_progress="full",
+    )
+    clear_btn.click(fn=lambda: "", inputs=None, outputs=input_box, queue=False)
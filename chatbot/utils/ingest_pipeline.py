@@ -0,0 +1,355 @@
+import argparse
+import hashlib
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set
+
+import bs4
+from langchain_community.document_loaders import WebBaseLoader
+from langchain_core.embeddings import Embeddings
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+QUEUE_SIZE: int = 64
+LOAD_WORKERS: int = 4
+EMBED_WORKERS: int = 2
+EMBED_BATCH_SIZE: int = 32
+PROGRESS_SECONDS: float = 10.0
+LOCAL_EXTENSIONS = (".html", ".htm", ".txt", ".md")
+_DONE = object()
+
+
+class Source(NamedTuple):
+    """A web page URL or a local file path."""
+
+    location: str
+    is_url: bool
+
+
+class Chunk(NamedTuple):
+    id: str
+    source: str
+    text: str
+
+
+class StageStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, items_in: int, items_out: int, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self.items_in += items_in
+            self.items_out += items_out
+            self.busy_seconds += seconds
+            self.errors += int(failed)
+
+    def summary(self, wall_seconds: float) -> str:
+        rate = self.items_out / wall_seconds if wall_seconds else 0.0
+        return (
+            f"{self.name:<7} in {self.items_in:>8}  out {self.items_out:>8}  {rate:>9.1f}/s  "
+            f"busy {self.busy_seconds:>8.1f}s  errors {self.errors}"
+        )
+
+
+def url_sources(urls: Iterable[str]) -> Iterator[Source]:
+    for url in urls:
+        url = url.strip()
+        if url:
+            yield Source(url, True)
+
+
+def directory_sources(directory: str) -> Iterator[Source]:
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if name.lower().endswith(LOCAL_EXTENSIONS):
+                yield Source(os.path.join(root, name), False)
+
+
+def load_source(source: Source, soup_class: Optional[str], separator: str) -> str:
+    strainer = bs4.SoupStrainer(class_=soup_class) if soup_class else None
+    if source.is_url:
+        web_loader = WebBaseLoader(
+            web_paths=[source.location],
+            bs_kwargs={"parse_only": strainer} if strainer else {},
+            bs_get_text_kwargs={"separator": separator, "strip": True},
+        )
+        return "".join(doc.page_content for doc in web_loader.lazy_load())
+    with open(source.location, encoding="utf-8", errors="ignore") as f:
+        content = f.read()
+    if source.location.lower().endswith((".html", ".htm")):
+        return bs4.BeautifulSoup(content, "html.parser", parse_only=strainer).get_text(separator=separator, strip=True)
+    return content
+
+
+def clean_text(content: str, replacer: List[str]) -> str:
+    # Replaced by a space rather than removed: the corpus's replacer is the non-breaking space between words.
+    for replace in replacer:
+        content = content.replace(replace, " ")
+    return content
+
+
+def upsert_embedded(vector_store, chunks: List[Chunk], vectors: List[List[float]]) -> None:
+    """
+    Upserts chunks with their precomputed vectors into a langchain-chroma `Chroma` store.
+
+    The store's public add_texts/add_documents always re-embed, so this writes to the
+    underlying chromadb collection through the private `_collection` attribute of
+    langchain-chroma 0.2.x (0.2.1 is pinned in requirements.txt; 0.2.6 behaves the same).
+    Check it here when upgrading langchain-chroma.
+    """
+    vector_store._collection.upsert(
+        ids=[chunk.id for chunk in chunks],
+        embeddings=vectors,
+        documents=[chunk.text for chunk in chunks],
+        metadatas=[{"source": chunk.source} for chunk in chunks],
+    )
+
+
+def chunk_id(source: str, index: int) -> str:
+    return f"{hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]}-{index}"
+
+
+class Checkpoint:
+    """Append-only record of fully ingested sources, so an interrupted run can resume where it stopped."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.done: Set[str] = set()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.done = {line.rstrip("\n") for line in f if line.strip()}
+
+    def mark(self, source: str) -> None:
+        with self._lock:
+            self.done.add(source)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(source + "\n")
+
+
+class IngestPipeline:
+    """
+    Streams sources through load -> clean -> split -> embed -> upsert.
+
+    Stages run on their own worker threads and are connected by bounded queues, so
+    at most a few queues' worth of pages and chunks are in memory at any time no
+    matter how large the corpus is. Only load and embed scale with more threads:
+    loading waits on the network or disk and the embedding model releases the GIL.
+    Clean and split are pure Python and hold the GIL, so each runs on one thread;
+    they are cheap next to embedding. Chunk ids are deterministic, which makes the
+    upsert idempotent: re-running after an interruption redoes at most the sources
+    that were in flight, and sources listed in the checkpoint are skipped entirely.
+    A source listed more than once is ingested once.
+    """
+
+    def __init__(
+        self,
+        vector_store,
+        embeddings: Embeddings,
+        soup_class: Optional[str] = None,
+        separator: str = " ",
+        replacer: Optional[List[str]] = None,
+        chunk_size: int = 500,
+        chunk_overlap: int = 0,
+        load_workers: int = LOAD_WORKERS,
+        embed_workers: int = EMBED_WORKERS,
+        embed_batch_size: int = EMBED_BATCH_SIZE,
+        queue_size: int = QUEUE_SIZE,
+        checkpoint_path: Optional[str] = None,
+        progress_seconds: float = PROGRESS_SECONDS,
+    ):
+        self.vector_store = vector_store
+        self.embeddings = embeddings
+        self.soup_class = soup_class
+        self.separator = separator
+        self.replacer = replacer or []
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=len,
+            is_separator_regex=False,
+        )
+        self.workers = {"load": load_workers, "clean": 1, "split": 1, "embed": embed_workers, "upsert": 1}
+        self.embed_batch_size = embed_batch_size
+        self.queue_size = queue_size
+        self.checkpoint = Checkpoint(checkpoint_path)
+        self.progress_seconds = progress_seconds
+        self.stats: Dict[str, StageStats] = {name: StageStats(name) for name in self.workers}
+        self._remaining: Dict[str, int] = {}
+        self._remaining_lock = threading.Lock()
+
+    # --- Stage functions: each takes a list of inputs and returns a list of outputs ---
+    def _load(self, sources: List[Source]) -> List[tuple]:
+        return [(source.location, load_source(source, self.soup_class, self.separator)) for source in sources]
+
+    def _clean(self, pages: List[tuple]) -> List[tuple]:
+        return [(location, clean_text(content, self.replacer)) for location, content in pages]
+
+    def _split(self, pages: List[tuple]) -> List[Chunk]:
+        chunks = []
+        for location, content in pages:
+            texts = self.text_splitter.split_text(content)
+            if not texts:
+                self.checkpoint.mark(location)
+                continue
+            with self._remaining_lock:
+                self._remaining[location] = len(texts)
+            chunks.extend(Chunk(chunk_id(location, index), location, text) for index, text in enumerate(texts))
+        return chunks
+
+    def _embed(self, chunks: List[Chunk]) -> List[tuple]:
+        vectors = self.embeddings.embed_documents([chunk.text for chunk in chunks])
+        return list(zip(chunks, vectors))
+
+    def _upsert(self, embedded: List[tuple]) -> List[Chunk]:
+        chunks = [chunk for chunk, _ in embedded]
+        upsert_embedded(self.vector_store, chunks, [vector for _, vector in embedded])
+        for chunk in chunks:
+            with self._remaining_lock:
+                self._remaining[chunk.source] -= 1
+                finished = self._remaining[chunk.source] == 0
+                if finished:
+                    del self._remaining[chunk.source]
+            if finished:
+                self.checkpoint.mark(chunk.source)
+        return chunks
+
+    def _worker(self, name: str, func: Callable, inbox: queue.Queue, outbox: Optional[queue.Queue], batch: int):
+        stats = self.stats[name]
+        finished = False
+        while not finished:
+            items = [inbox.get()]
+            # Batch whatever is already waiting, without holding a batch back for more input.
+            while len(items) < batch and items[-1] is not _DONE:
+                try:
+                    items.append(inbox.get_nowait())
+                except queue.Empty:
+                    break
+            if items[-1] is _DONE:
+                items.pop()
+                finished = True
+            if not items:
+                continue
+            start = time.perf_counter()
+            try:
+                outputs = func(items)
+            except Exception as exc:
+                stats.record(len(items), 0, time.perf_counter() - start, failed=True)
+                print(f"{name} stage failed on {len(items)} item(s): {exc}")
+                continue
+            stats.record(len(items), len(outputs), time.perf_counter() - start)
+            if outbox is not None:
+                for output in outputs:
+                    outbox.put(output)
+
+    def run(self, sources: Iterable[Source]) -> Dict[str, StageStats]:
+        stages = [
+            ("load", self._load, 1),
+            ("clean", self._clean, 1),
+            ("split", self._split, 1),
+            ("embed", self._embed, self.embed_batch_size),
+            ("upsert", self._upsert, self.embed_batch_size),
+        ]
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in stages]
+        threads = []
+        for index, (name, func, batch) in enumerate(stages):
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            threads.append(
+                [
+                    threading.Thread(
+                        target=self._worker, args=(name, func, queues[index], outbox, batch), name=f"ingest-{name}"
+                    )
+                    for _ in range(self.workers[name])
+                ]
+            )
+        for stage_threads in threads:
+            for thread in stage_threads:
+                thread.daemon = True
+                thread.start()
+
+        start = time.perf_counter()
+        feeder = threading.Thread(target=self._feed, args=(sources, queues[0]), daemon=True)
+        feeder.start()
+        self._wait(feeder, start)
+        # Shut stages down in order: once every worker of a stage exits, the next one has all its input.
+        for index, stage_threads in enumerate(threads):
+            for _ in stage_threads:
+                queues[index].put(_DONE)
+            for thread in stage_threads:
+                self._wait(thread, start)
+        self._print_progress(time.perf_counter() - start)
+        return self.stats
+
+    def _wait(self, thread: threading.Thread, start: float) -> None:
+        while thread.is_alive():
+            thread.join(self.progress_seconds)
+            if thread.is_alive():
+                self._print_progress(time.perf_counter() - start)
+
+    def _feed(self, sources: Iterable[Source], inbox: queue.Queue) -> None:
+        # A repeat would be split again while its first copy is still being upserted and reset its chunk count.
+        seen: Set[str] = set()
+        for source in sources:
+            if source.location not in self.checkpoint.done and source.location not in seen:
+                seen.add(source.location)
+                inbox.put(source)
+
+    def _print_progress(self, wall_seconds: float) -> None:
+        print(f"--- ingest progress after {wall_seconds:.1f}s ---")
+        for stats in self.stats.values():
+            print(stats.summary(wall_seconds))
+
+
+def main():
+    # Imported here so the pipeline module itself stays free of the chatbot's startup indexing.
+    from langchain_chroma import Chroma
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    parser = argparse.ArgumentParser(description="Stream a large document corpus into a persistent Chroma store.")
+    parser.add_argument("--urls-file", help="text file with one URL per line")
+    parser.add_argument("--directory", help="directory of .html/.htm/.txt/.md files")
+    parser.add_argument("--persist-directory", required=True, help="where the Chroma collection is stored")
+    parser.add_argument("--collection", default="langchain", help="Chroma collection name")
+    parser.add_argument("--model-name", default="sentence-transformers/all-mpnet-base-v2")
+    parser.add_argument("--soup-class", default=None, help="only keep HTML elements with this class")
+    parser.add_argument("--checkpoint", default=None, help="file recording finished sources (default: in store)")
+    parser.add_argument("--load-workers", type=int, default=LOAD_WORKERS)
+    parser.add_argument("--embed-workers", type=int, default=EMBED_WORKERS)
+    parser.add_argument("--embed-batch-size", type=int, default=EMBED_BATCH_SIZE)
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE)
+    args = parser.parse_args()
+
+    def sources() -> Iterator[Source]:
+        if args.urls_file:
+            with open(args.urls_file, encoding="utf-8") as f:
+                yield from url_sources(f)
+        if args.directory:
+            yield from directory_sources(args.directory)
+
+    embeddings = HuggingFaceEmbeddings(model_name=args.model_name)
+    vector_store = Chroma(
+        collection_name=args.collection, embedding_function=embeddings, persist_directory=args.persist_directory
+    )
+    pipeline = IngestPipeline(
+        vector_store,
+        embeddings,
+        soup_class=args.soup_class,
+        replacer=["\xa0"],
+        load_workers=args.load_workers,
+        embed_workers=args.embed_workers,
+        embed_batch_size=args.embed_batch_size,
+        queue_size=args.queue_size,
+        checkpoint_path=args.checkpoint or os.path.join(args.persist_directory, "ingested_sources.txt"),
+    )
+    pipeline.run(sources())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,12 @@
 from typing import List, Callable
 from langchain_ollama import ChatOllama
 from langchain_core.messages import trim_messages
+from chatbot.utils.tool_calls.option_greeks import get_option_greeks
 from chatbot.utils.tool_calls.yahoo_finance import get_stock_info
 
 MODEL_NAME: str = "llama3.1"
 MAX_TOKEN: int = 500
-tools: List[Callable] = [get_stock_info]
+tools: List[Callable] = [get_stock_info, get_option_greeks]
 model = ChatOllama(model=MODEL_NAME, temperature=0).bind_tools(tools)
 
 trimmer = trim_messages(
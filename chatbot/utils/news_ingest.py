@@ -0,0 +1,187 @@
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from langchain_chroma import Chroma
+
+from chatbot.utils.document_helper import VECTOR_DATABASE
+
+NEWS_SOURCE: str = "scraped_news"
+BATCH_SIZE: int = 16
+BATCH_WAIT_SECONDS: float = 2.0
+MAX_AGE_HOURS: float = 48.0
+EXPIRE_EVERY_SECONDS: float = 300.0
+FOLLOW_INTERVAL_SECONDS: float = 60.0
+# A batch the store rejects is re-queued this many times in all, RETRY_WAIT_SECONDS apart.
+MAX_ATTEMPTS: int = 3
+RETRY_WAIT_SECONDS: float = 5.0
+
+
+def news_id(link: str) -> str:
+    # Same identity as the scraper poller's item hash, so a story maps to one vector.
+    return hashlib.sha1(link.encode("utf-8")).hexdigest()
+
+
+def to_epoch(timestamp: Optional[str]) -> float:
+    if not timestamp:
+        return time.time()
+    parsed = datetime.fromisoformat(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class NewsIngestor:
+    """
+    Upserts scraped news items into the running vector store in small background batches.
+
+    Items are deduplicated by link hash before anything is embedded, and items older
+    than `max_age_hours` are deleted periodically. A batch that fails to upsert is
+    re-queued up to MAX_ATTEMPTS times before its items are given up on. Chats keep querying the store while
+    this runs; no lock is held around `query_relevant_text`.
+    """
+
+    def __init__(
+        self,
+        vector_store: Chroma = VECTOR_DATABASE,
+        batch_size: int = BATCH_SIZE,
+        max_age_hours: float = MAX_AGE_HOURS,
+    ):
+        self.vector_store = vector_store
+        self.batch_size = batch_size
+        self.max_age_seconds = max_age_hours * 3600
+        self._pending: queue.Queue = queue.Queue()
+        self._ingested: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._last_expiry = 0.0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._stop.clear()
+                self._worker = threading.Thread(target=self._run, name="news-ingest", daemon=True)
+                self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join()
+
+    def submit(self, items: Iterable[Dict[str, str]]) -> int:
+        """Queues items with `headline`, `link` and optional `published`/`source`; returns how many were new."""
+        self.start()
+        cutoff = time.time() - self.max_age_seconds
+        queued = 0
+        with self._lock:
+            for item in items:
+                key = news_id(item["link"])
+                published_at = to_epoch(item.get("published"))
+                if key in self._ingested or published_at < cutoff:
+                    continue
+                self._ingested[key] = published_at
+                self._pending.put((key, published_at, item, 1))
+                queued += 1
+        return queued
+
+    def _next_batch(self) -> List[tuple]:
+        batch = []
+        try:
+            batch.append(self._pending.get(timeout=BATCH_WAIT_SECONDS))
+            while len(batch) < self.batch_size:
+                batch.append(self._pending.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._upsert(batch)
+            if time.time() - self._last_expiry >= EXPIRE_EVERY_SECONDS:
+                try:
+                    self.expire()
+                except Exception as exc:
+                    print(f"Failed to expire old news: {exc}")
+
+    def _upsert(self, batch: List[tuple]) -> None:
+        texts = [item["headline"] for _, _, item, _ in batch]
+        metadatas = [
+            {
+                "source": NEWS_SOURCE,
+                "origin": item.get("source", ""),
+                "link": item["link"],
+                "published_at": published_at,
+            }
+            for _, published_at, item, _ in batch
+        ]
+        ids = [key for key, _, _, _ in batch]
+        try:
+            # Chroma's add_texts upserts by id, so a batch that partly landed before failing is safe to retry.
+            self.vector_store.add_texts(texts=texts, metadatas=metadatas, ids=ids)
+        except Exception as exc:
+            given_up = [key for key, _, _, attempts in batch if attempts >= MAX_ATTEMPTS]
+            print(
+                f"Failed to ingest {len(batch)} news items: {exc} "
+                f"({len(batch) - len(given_up)} re-queued, {len(given_up)} given up after {MAX_ATTEMPTS} attempts)"
+            )
+            with self._lock:
+                # Forgotten, so submitting them again later is not ignored as a duplicate.
+                for key in given_up:
+                    self._ingested.pop(key, None)
+            for key, published_at, item, attempts in batch:
+                if attempts < MAX_ATTEMPTS:
+                    self._pending.put((key, published_at, item, attempts + 1))
+            self._stop.wait(RETRY_WAIT_SECONDS)
+
+    def expire(self) -> int:
+        """Deletes news older than the max age from the store; returns how many were removed."""
+        self._last_expiry = time.time()
+        cutoff = self._last_expiry - self.max_age_seconds
+        expired = self.vector_store.get(
+            where={"$and": [{"source": NEWS_SOURCE}, {"published_at": {"$lt": cutoff}}]}, include=[]
+        )["ids"]
+        if expired:
+            self.vector_store.delete(ids=expired)
+        with self._lock:
+            for key in [key for key, published_at in self._ingested.items() if published_at < cutoff]:
+                del self._ingested[key]
+        return len(expired)
+
+    def follow_store(self, db_path: str, interval: float = FOLLOW_INTERVAL_SECONDS) -> threading.Thread:
+        """Tails the scraper poller's SQLite `news_items` table and submits rows as they appear."""
+        self.start()
+        follower = threading.Thread(target=self._follow, args=(db_path, interval), name="news-follow", daemon=True)
+        follower.start()
+        return follower
+
+    def _follow(self, db_path: str, interval: float) -> None:
+        last_rowid = 0
+        while not self._stop.is_set():
+            try:
+                with closing(sqlite3.connect(db_path)) as connection:
+                    rows = connection.execute(
+                        "SELECT rowid, source, COALESCE(published, first_seen), headline, link "
+                        "FROM news_items WHERE rowid > ? ORDER BY rowid",
+                        (last_rowid,),
+                    ).fetchall()
+            except sqlite3.Error as exc:
+                print(f"Could not read news from {db_path}: {exc}")
+                rows = []
+            if rows:
+                last_rowid = rows[-1][0]
+                self.submit(
+                    {"source": source, "published": published, "headline": headline, "link": link}
+                    for _, source, published, headline, link in rows
+                )
+            self._stop.wait(interval)
+
+
+NEWS_INGESTOR = NewsIngestor()
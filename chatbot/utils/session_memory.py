@@ -0,0 +1,50 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import List
+
+from langgraph.checkpoint.memory import MemorySaver
+
+# Conversations kept in memory; the least recently used ones are dropped beyond this.
+MAX_SESSIONS: int = int(os.getenv("CHAT_MAX_SESSIONS", "1000"))
+
+
+class BoundedMemorySaver(MemorySaver):
+    """
+    MemorySaver that keeps only the `max_threads` most recently used threads.
+
+    Every browser session gets its own thread_id, so an unbounded MemorySaver grows for
+    as long as the server runs. Each checkpoint write marks its thread as used, and the
+    least recently used threads beyond the limit are deleted, so a returning user whose
+    conversation was evicted starts a new one. aput goes through put, so both paths count.
+    Keep `max_threads` well above the number of chats generated at once (CHAT_CONCURRENCY),
+    so a conversation is never evicted while its own turn is still running.
+    Needs langgraph-checkpoint 2.0.25 or later for delete_thread.
+    """
+
+    def __init__(self, max_threads: int = MAX_SESSIONS):
+        super().__init__()
+        self.max_threads = max_threads
+        self._recent: OrderedDict = OrderedDict()
+        self._recent_lock = threading.Lock()
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        saved = super().put(config, checkpoint, metadata, new_versions)
+        for thread_id in self._touch(config["configurable"]["thread_id"]):
+            self.delete_thread(thread_id)
+        return saved
+
+    def _touch(self, thread_id: str) -> List[str]:
+        with self._recent_lock:
+            self._recent[thread_id] = None
+            self._recent.move_to_end(thread_id)
+            evicted = []
+            while len(self._recent) > self.max_threads:
+                evicted.append(self._recent.popitem(last=False)[0])
+        return evicted
+
+    @property
+    def thread_ids(self) -> List[str]:
+        """Threads currently kept, least recently used first."""
+        with self._recent_lock:
+            return list(self._recent)
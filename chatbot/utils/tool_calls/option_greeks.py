@@ -0,0 +1,104 @@
+import json
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.tools import tool
+
+from chatbot.utils.black_scholes import greeks, implied_volatility
+
+DEFAULT_RATE: float = 0.045
+DAYS_PER_YEAR: float = 365.0
+OPTION_TYPES = ("call", "put", "both")
+DECIMALS: int = 4
+
+
+def _rounded(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(value) else round(float(value), DECIMALS) for value in values]
+
+
+def price_chain(
+    spot: float,
+    strikes: List[float],
+    days_to_expiry: List[float],
+    volatility: Optional[float] = None,
+    market_prices: Optional[List[float]] = None,
+    option_type: str = "call",
+    rate: float = DEFAULT_RATE,
+    dividend_yield: float = 0.0,
+) -> List[dict]:
+    """
+    Prices every strike at every expiry (expiry-major order) in one batched call.
+
+    With `market_prices` (one per contract, same order) the implied volatility of each
+    contract is solved first and its Greeks use it; otherwise `volatility` is used.
+    Theta is per calendar day, vega and rho per one percentage point.
+    """
+    if option_type not in OPTION_TYPES:
+        raise ValueError(f"option_type must be one of {', '.join(OPTION_TYPES)}")
+    kinds = [True, False] if option_type == "both" else [option_type == "call"]
+    expiry_grid, strike_grid, call_grid = np.meshgrid(
+        np.asarray(days_to_expiry, dtype=np.float64) / DAYS_PER_YEAR,
+        np.asarray(strikes, dtype=np.float64),
+        np.asarray(kinds),
+        indexing="ij",
+    )
+    expiry, strike, is_call = expiry_grid.ravel(), strike_grid.ravel(), call_grid.ravel()
+
+    if market_prices is not None:
+        prices = np.asarray(market_prices, dtype=np.float64)
+        if prices.shape != strike.shape:
+            raise ValueError(f"expected {strike.size} market prices (one per contract), got {prices.size}")
+        vols = implied_volatility(prices, spot, strike, expiry, rate, dividend_yield, is_call)
+    elif volatility:
+        vols = np.full(strike.shape, volatility, dtype=np.float64)
+    else:
+        raise ValueError("pass either a volatility or the contracts' market prices")
+
+    values = greeks(spot, strike, expiry, vols, rate, dividend_yield, is_call)
+    columns = {
+        "type": ["call" if call else "put" for call in is_call],
+        "strike": strike.tolist(),
+        "days_to_expiry": _rounded(expiry * DAYS_PER_YEAR),
+        "implied_volatility": _rounded(vols),
+        "price": _rounded(values.price),
+        "delta": _rounded(values.delta),
+        "gamma": _rounded(values.gamma),
+        "theta_per_day": _rounded(values.theta / DAYS_PER_YEAR),
+        "vega_per_pct": _rounded(values.vega / 100),
+        "rho_per_pct": _rounded(values.rho / 100),
+    }
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+@tool
+def get_option_greeks(
+    spot: float,
+    strikes: List[float],
+    days_to_expiry: List[float],
+    volatility: Optional[float] = None,
+    market_prices: Optional[List[float]] = None,
+    option_type: str = "call",
+    rate: float = DEFAULT_RATE,
+    dividend_yield: float = 0.0,
+) -> str:
+    """Get Black-Scholes price, delta, gamma, theta, vega, rho and implied volatility for an option chain.
+
+    Every strike is priced at every expiry. Theta is per day, vega and rho per 1% move.
+
+    Args:
+        spot (float): current price of the underlying stock
+        strikes (List[float]): strike prices to price
+        days_to_expiry (List[float]): calendar days until each expiry
+        volatility (float): annualized volatility as a decimal, e.g. 0.25 for 25%; not needed with market_prices
+        market_prices (List[float]): observed prices, one per contract by expiry then strike,
+            to solve implied volatility
+        option_type (str): "call", "put" or "both"
+        rate (float): annual risk-free rate as a decimal
+        dividend_yield (float): annual dividend yield as a decimal
+    """
+    try:
+        return json.dumps(
+            price_chain(spot, strikes, days_to_expiry, volatility, market_prices, option_type, rate, dividend_yield)
+        )
+    except ValueError as exc:
+        return f"Could not price the option chain: {exc}"
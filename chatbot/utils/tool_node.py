@@ -0,0 +1,139 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import BaseTool
+
+TOOL_WORKERS: int = int(os.getenv("TOOL_WORKERS", "8"))
+TOOL_TIMEOUT_SECONDS: float = float(os.getenv("TOOL_TIMEOUT_SECONDS", "15"))
+LATENCY_SAMPLES: int = 512
+
+TIMEOUT: str = "timeout"
+FAILED: str = "failed"
+UNKNOWN_TOOL: str = "unknown_tool"
+
+
+class ToolStats:
+    """
+    Latency of one tool. Every call that ran is timed, including one that finishes
+    after its node already gave up on it; timeouts are counted separately.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.max_seconds = 0.0
+        self.recent = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            self.errors += int(failed)
+            self.max_seconds = max(self.max_seconds, seconds)
+            self.recent.append(seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def summary(self) -> str:
+        with self._lock:
+            samples = list(self.recent)
+        p50, p95 = np.percentile(samples, [50, 95]) if samples else (0.0, 0.0)
+        return (
+            f"{self.name:<20} calls {self.calls:>6}  p50 {p50 * 1000:>8.1f}ms  p95 {p95 * 1000:>8.1f}ms  "
+            f"max {self.max_seconds * 1000:>8.1f}ms  timeouts {self.timeouts}  errors {self.errors}"
+        )
+
+
+class ParallelToolNode:
+    """
+    Runs every tool call of the last AI message concurrently on a bounded thread pool.
+
+    Each call gets `timeout` seconds, counted from when the node starts (time spent
+    waiting for a free worker counts too). A call that misses it, raises, or names an
+    unknown tool is answered with a JSON error ToolMessage (status="error") so the
+    model can recover instead of the graph stalling. A timed-out call cannot be killed
+    and keeps its worker until it returns; the pool size bounds how many can pile up.
+    """
+
+    def __init__(
+        self, tools: Sequence[BaseTool], max_workers: int = TOOL_WORKERS, timeout: float = TOOL_TIMEOUT_SECONDS
+    ):
+        self.tools: Dict[str, BaseTool] = {tool.name: tool for tool in tools}
+        self.timeout = timeout
+        self.stats: Dict[str, ToolStats] = {name: ToolStats(name) for name in self.tools}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tool")
+
+    def _execute(self, call: Dict[str, Any]) -> ToolMessage:
+        tool = self.tools[call["name"]]
+        start = time.perf_counter()
+        try:
+            output = tool.invoke(call["args"])
+        except Exception as exc:
+            self.stats[tool.name].record(time.perf_counter() - start, failed=True)
+            return self._error(call, FAILED, f"{type(exc).__name__}: {exc}")
+        self.stats[tool.name].record(time.perf_counter() - start)
+        content = output if isinstance(output, str) else json.dumps(output, default=str)
+        return ToolMessage(content=content, name=tool.name, tool_call_id=call["id"])
+
+    def _error(self, call: Dict[str, Any], error: str, message: str) -> ToolMessage:
+        content = json.dumps({"error": error, "tool": call["name"], "message": message})
+        return ToolMessage(content=content, name=call["name"], tool_call_id=call["id"], status="error")
+
+    def _timed_out(self, call: Dict[str, Any]) -> ToolMessage:
+        self.stats[call["name"]].record_timeout()
+        return self._error(call, TIMEOUT, f"no result within {self.timeout}s")
+
+    def _unknown(self, call: Dict[str, Any]) -> ToolMessage:
+        return self._error(call, UNKNOWN_TOOL, f"available tools: {', '.join(self.tools)}")
+
+    @staticmethod
+    def _tool_calls(state) -> List[Dict[str, Any]]:
+        message = state["messages"][-1]
+        return message.tool_calls if isinstance(message, AIMessage) else []
+
+    def invoke(self, state) -> Dict[str, List[ToolMessage]]:
+        deadline = time.monotonic() + self.timeout
+        futures = [
+            (call, self._executor.submit(self._execute, call) if call["name"] in self.tools else None)
+            for call in self._tool_calls(state)
+        ]
+        messages = []
+        for call, future in futures:
+            if future is None:
+                messages.append(self._unknown(call))
+                continue
+            try:
+                messages.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                future.cancel()
+                messages.append(self._timed_out(call))
+        return {"messages": messages}
+
+    async def _aexecute(self, call: Dict[str, Any]) -> ToolMessage:
+        if call["name"] not in self.tools:
+            return self._unknown(call)
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(self._executor, self._execute, call), self.timeout)
+        except asyncio.TimeoutError:
+            return self._timed_out(call)
+
+    async def ainvoke(self, state) -> Dict[str, List[ToolMessage]]:
+        # Tools such as yfinance are blocking, so the async path uses the same bounded pool.
+        messages = await asyncio.gather(*(self._aexecute(call) for call in self._tool_calls(state)))
+        return {"messages": list(messages)}
+
+    def latency_report(self) -> str:
+        return "\n".join(stats.summary() for stats in self.stats.values())
@@ -0,0 +1,305 @@
+# Offline load test for the two Gradio apps. Starts the app in a child process with
+# stub backends (see serve_chatbot.py / serve_custom_gpt.py), drives N concurrent
+# simulated sessions through the Gradio API, samples the server's memory, and
+# prints throughput, latency and queue-wait percentiles.
+#
+#    python -m load_test.run --app chatbot --sessions 16 --turns 5 --latency 2 --concurrency 4
+#    python -m load_test.run --app custom_gpt --sessions 16 --turns 5 --latency 1 --concurrency 8
+#    python -m load_test.run --app chatbot --sessions 32 --ramp 10 --output chatbot_load.csv
+#
+# Latency is from submit to result as a client sees it; queue wait is the part spent
+# before Gradio reported the event as started (so it carries the queue's status update
+# delay, typically well under a second); service is the rest. Needs both apps'
+# requirements installed; nothing is fetched from the network.
+
+import argparse
+import csv
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import Counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from gradio_client import Client
+from gradio_client.utils import Status
+
+from load_test.stubs import MockOpenAIServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+POLL_SECONDS = 0.01
+MEMORY_SAMPLE_SECONDS = 0.5
+RUNNING = (Status.PROCESSING, Status.ITERATING, Status.PROGRESS)
+QUESTIONS = [
+    "What is a covered call?",
+    "How does an iron condor make money?",
+    "When would I buy a married put?",
+    "What does theta decay mean for option sellers?",
+    "How is implied volatility used to price options?",
+    "What is the maximum loss on a vertical spread?",
+]
+
+
+class AppTarget(NamedTuple):
+    launcher: str
+    api_name: str
+    # (turn, session state) -> endpoint arguments
+    inputs: Callable[[int, Any], list]
+    # (endpoint result, session state) -> (error or None, new session state)
+    outcome: Callable[[Any, Any], Tuple[Optional[str], Any]]
+
+
+class RequestRecord(NamedTuple):
+    session: int
+    turn: int
+    submitted: float
+    queue_wait: float
+    latency: float
+    error: Optional[str]
+
+
+def chatbot_outcome(result, state):
+    return (None if result else "empty reply"), state
+
+
+def custom_gpt_inputs(turn, history):
+    return [QUESTIONS[turn % len(QUESTIONS)], "gpt-4.1-nano", 500, 0.0, history or []]
+
+
+def custom_gpt_outcome(result, history):
+    # Outputs are (chatbot history, cleared message box, status text, status visibility).
+    new_history, _, status, _ = result
+    return (status or None), new_history
+
+
+APPS: Dict[str, AppTarget] = {
+    "chatbot": AppTarget(
+        "load_test.serve_chatbot", "/respond", lambda turn, _: [QUESTIONS[turn % len(QUESTIONS)]], chatbot_outcome
+    ),
+    "custom_gpt": AppTarget("load_test.serve_custom_gpt", "/handle_message", custom_gpt_inputs, custom_gpt_outcome),
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mb(pid: int) -> Optional[float]:
+    """Resident memory of `pid` from /proc (Linux only; None elsewhere)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+class MemorySampler:
+    def __init__(self, pid: int, interval: float = MEMORY_SAMPLE_SECONDS):
+        self.pid = pid
+        self.interval = interval
+        self.samples: List[float] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            rss = rss_mb(self.pid)
+            if rss is not None:
+                self.samples.append(rss)
+            self._stop.wait(self.interval)
+
+    def start(self) -> "MemorySampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def start_app(launcher: str, port: int, extra_args: List[str], log_path: str, timeout: float) -> subprocess.Popen:
+    """Starts the launcher module and waits until the Gradio app answers on `port`."""
+    log = open(log_path, "w")
+    process = subprocess.Popen(
+        [sys.executable, "-m", launcher, "--port", str(port), *extra_args],
+        cwd=REPO_ROOT,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{launcher} exited with code {process.returncode}, see {log_path}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=2):
+                return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"{launcher} did not start within {timeout}s, see {log_path}")
+
+
+def run_session(
+    url: str, target: AppTarget, session: int, turns: int, think: float, delay: float, start: threading.Barrier, records
+) -> None:
+    try:
+        client = Client(url, verbose=False)
+    except Exception as exc:
+        start.wait()
+        records.append(RequestRecord(session, 0, time.perf_counter(), 0.0, 0.0, f"could not connect: {exc}"))
+        return
+    state = None
+    start.wait()
+    time.sleep(delay)
+    for turn in range(turns):
+        submitted = time.perf_counter()
+        started = None
+        try:
+            job = client.submit(*target.inputs(turn, state), api_name=target.api_name)
+            while not job.done():
+                if started is None and job.status().code in RUNNING:
+                    started = time.perf_counter()
+                time.sleep(POLL_SECONDS)
+            error, state = target.outcome(job.result(), state)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        finished = time.perf_counter()
+        records.append(
+            RequestRecord(session, turn, submitted, (started or finished) - submitted, finished - submitted, error)
+        )
+        if think:
+            time.sleep(think)
+
+
+def run_load(
+    url: str, target: AppTarget, sessions: int, turns: int, think: float = 0.0, ramp: float = 0.0
+) -> Tuple[List[RequestRecord], float]:
+    records: List[RequestRecord] = []
+    # Every session connects before any sends, so client setup is not counted as load.
+    start = threading.Barrier(sessions + 1)
+    threads = [
+        threading.Thread(
+            target=run_session,
+            args=(url, target, session, turns, think, ramp * session / sessions, start, records),
+            name=f"session-{session}",
+        )
+        for session in range(sessions)
+    ]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return records, time.perf_counter() - began
+
+
+def percentiles(values: List[float]) -> str:
+    if not values:
+        return "       -"
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return f"{p50:>8.2f} {p95:>8.2f} {p99:>8.2f} {max(values):>8.2f}"
+
+
+def print_report(app: str, records: List[RequestRecord], wall: float, memory: List[float], baseline: Optional[float]):
+    ok = [record for record in records if record.error is None]
+    print(f"\n--- Load Test Report: {app} ---")
+    print(f"{len(records)} requests, {len(ok)} ok, {len(records) - len(ok)} failed in {wall:.2f}s")
+    print(f"Throughput {len(ok) / wall:.2f} req/s")
+    print(f"{'seconds':<14} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    print(f"{'latency':<14} {percentiles([r.latency for r in ok])}")
+    print(f"{'queue wait':<14} {percentiles([r.queue_wait for r in ok])}")
+    print(f"{'service':<14} {percentiles([r.latency - r.queue_wait for r in ok])}")
+    if memory and baseline is not None:
+        growth = memory[-1] - baseline
+        print(
+            f"Server RSS: baseline {baseline:.0f} MB, peak {max(memory):.0f} MB, end {memory[-1]:.0f} MB, "
+            f"growth {growth:+.1f} MB ({growth * 1024 / max(len(records), 1):+.1f} KB per request)"
+        )
+    else:
+        print("Server RSS: not available on this platform")
+    for error, count in Counter(r.error for r in records if r.error).most_common(3):
+        print(f"  {count} x {error}")
+    print("-" * 40)
+
+
+def write_records(path: str, records: List[RequestRecord]) -> None:
+    began = min(record.submitted for record in records)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(RequestRecord._fields)
+        for record in sorted(records, key=lambda r: r.submitted):
+            writer.writerow(record._replace(submitted=round(record.submitted - began, 4)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test a Gradio app offline with stub backends.")
+    parser.add_argument("--app", choices=sorted(APPS), default="chatbot")
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent simulated users")
+    parser.add_argument("--turns", type=int, default=5, help="messages each session sends, one after another")
+    parser.add_argument("--think", type=float, default=0.0, help="seconds a session waits between its messages")
+    parser.add_argument("--ramp", type=float, default=0.0, help="spread session starts over this many seconds")
+    parser.add_argument("--latency", type=float, default=1.0, help="seconds per stub model response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds added to each stub response")
+    parser.add_argument("--concurrency", type=int, default=None, help="Gradio concurrency limit for the chat event")
+    parser.add_argument("--queue-size", type=int, default=None, help="Gradio queue max_size")
+    parser.add_argument("--ollama-parallel", type=int, default=4, help="chatbot: generations the fake Ollama runs")
+    parser.add_argument("--startup-timeout", type=float, default=180.0)
+    parser.add_argument("--output", default=None, help="write one CSV row per request here")
+    args = parser.parse_args()
+
+    target = APPS[args.app]
+    port = free_port()
+    extra = ["--latency", str(args.latency), "--jitter", str(args.jitter)]
+    if args.concurrency is not None:
+        extra += ["--concurrency", str(args.concurrency)]
+    if args.queue_size is not None:
+        extra += ["--queue-size", str(args.queue_size)]
+    mock = None
+    if args.app == "chatbot":
+        extra += ["--ollama-parallel", str(args.ollama_parallel)]
+    else:
+        # Kept out of the app's process so its memory is not counted as the app's.
+        mock = MockOpenAIServer(latency=args.latency, jitter=args.jitter).start()
+        extra += ["--openai-base-url", mock.base_url]
+
+    log_path = os.path.join(tempfile.gettempdir(), f"load_test_{args.app}_{port}.log")
+    print(f"Starting {args.app} on port {port} (log: {log_path})")
+    process = start_app(target.launcher, port, extra, log_path, args.startup_timeout)
+    url = f"http://127.0.0.1:{port}/"
+    try:
+        # One request first, so lazy initialization is not counted as growth.
+        warmup, _ = run_load(url, target, sessions=1, turns=1)
+        if warmup[0].error:
+            raise RuntimeError(f"warm-up request failed: {warmup[0].error}")
+        baseline = rss_mb(process.pid)
+        sampler = MemorySampler(process.pid).start()
+        print(f"Running {args.sessions} sessions x {args.turns} turns, stub latency {args.latency}s")
+        records, wall = run_load(url, target, args.sessions, args.turns, args.think, args.ramp)
+        sampler.stop()
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+        if mock is not None:
+            mock.shutdown()
+
+    print_report(args.app, records, wall, sampler.samples, baseline)
+    if mock is not None:
+        print(f"Mock OpenAI endpoint served {mock.requests} requests")
+    if args.output:
+        write_records(args.output, records)
+        print(f"Per-request records written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
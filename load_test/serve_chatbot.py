@@ -0,0 +1,60 @@
+# Starts the options chatbot's Gradio app with stub backends, for load tests.
+# The graph, retrieval, tools node and Gradio queue are the real ones; only the
+# llama3.1 model, the embedding model and the Investopedia pages are replaced.
+#
+#    python -m load_test.serve_chatbot --port 7860 --latency 2 --ollama-parallel 4
+
+import argparse
+import os
+import tempfile
+
+from langchain_core.messages import trim_messages
+
+from load_test.stubs import FakeOllamaChatModel, UnitFakeEmbedding, approximate_token_count, write_corpus
+
+EMBEDDING_SIZE = 768
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the chatbot app with a fake Ollama model and fake embeddings.")
+    parser.add_argument("--port", type=int, default=7860)
+    parser.add_argument("--latency", type=float, default=1.0, help="seconds per fake generation")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds added to each generation")
+    parser.add_argument("--ollama-parallel", type=int, default=4, help="generations the fake server runs at once")
+    parser.add_argument("--concurrency", type=int, default=None, help="CHAT_CONCURRENCY for the Gradio queue")
+    parser.add_argument("--queue-size", type=int, default=None, help="CHAT_QUEUE_SIZE for the Gradio queue")
+    args = parser.parse_args()
+
+    # Settings the app reads at import time.
+    os.environ["USER_AGENT"] = "load_test"
+    os.environ["LANGSMITH_TRACING"] = "false"
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+    os.environ["CORPUS_DIRECTORY"] = write_corpus(tempfile.mkdtemp(prefix="chatbot_corpus_"))
+    if args.concurrency is not None:
+        os.environ["CHAT_CONCURRENCY"] = str(args.concurrency)
+    if args.queue_size is not None:
+        os.environ["CHAT_QUEUE_SIZE"] = str(args.queue_size)
+
+    # Swapped in before chat_app and document_helper import them by name.
+    from chatbot.utils import embeddings, llama_model
+
+    embeddings.build_embeddings = lambda *_, **__: UnitFakeEmbedding(size=EMBEDDING_SIZE)
+    llama_model.model = FakeOllamaChatModel(latency=args.latency, jitter=args.jitter, max_parallel=args.ollama_parallel)
+    llama_model.trimmer = trim_messages(
+        max_tokens=llama_model.MAX_TOKEN,
+        strategy="last",
+        token_counter=approximate_token_count,
+        include_system=True,
+        allow_partial=False,
+    )
+
+    from chatbot.utils.gradio_setup import CHAT_CONCURRENCY, CHAT_QUEUE_SIZE, demo
+
+    print(f"Chatbot on port {args.port}: concurrency {CHAT_CONCURRENCY}, queue size {CHAT_QUEUE_SIZE}", flush=True)
+    demo.queue(default_concurrency_limit=CHAT_CONCURRENCY, max_size=CHAT_QUEUE_SIZE).launch(
+        server_name="127.0.0.1", server_port=args.port, share=False
+    )
+
+
+if __name__ == "__main__":
+    main()
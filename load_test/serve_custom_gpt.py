@@ -0,0 +1,58 @@
+# Starts custom_gpt_app/gradio_chat_app.py against a mock OpenAI Responses endpoint, for load tests.
+#
+#    python -m load_test.serve_custom_gpt --port 7861 --latency 1.5
+#    python -m load_test.serve_custom_gpt --openai-base-url http://127.0.0.1:9000/v1
+#
+# The app's own .env is not loaded, so a real OPENAI_API_KEY there can never be used.
+
+import argparse
+import importlib.util
+import os
+import shutil
+import tempfile
+
+import dotenv
+
+from load_test.stubs import MockOpenAIServer
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "custom_gpt_app")
+MOCK_API_KEY = "sk-load-test"
+
+
+def load_app():
+    # The app reads style.css and writes logs/ relative to the working directory.
+    workdir = tempfile.mkdtemp(prefix="custom_gpt_app_")
+    shutil.copy(os.path.join(APP_DIR, "style.css"), workdir)
+    os.chdir(workdir)
+    spec = importlib.util.spec_from_file_location("gradio_chat_app", os.path.join(APP_DIR, "gradio_chat_app.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the custom GPT app against a mock OpenAI endpoint.")
+    parser.add_argument("--port", type=int, default=7861)
+    parser.add_argument("--openai-base-url", default="", help="mock endpoint to use (default: start one here)")
+    parser.add_argument("--latency", type=float, default=1.0, help="seconds per mock response, if started here")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=None, help="Gradio default_concurrency_limit")
+    parser.add_argument("--queue-size", type=int, default=None, help="Gradio queue max_size")
+    args = parser.parse_args()
+
+    base_url = args.openai_base_url or MockOpenAIServer(latency=args.latency, jitter=args.jitter).start().base_url
+    os.environ["OPENAI_API_KEY"] = MOCK_API_KEY
+    os.environ["OPENAI_BASE_URL"] = base_url
+    dotenv.load_dotenv = lambda *_, **__: False
+
+    demo = load_app().demo
+    # Unset keeps what the app runs with today: Gradio's default of one event at a time.
+    concurrency = args.concurrency if args.concurrency is not None else "not_set"
+    print(f"Custom GPT app on port {args.port}: OpenAI at {base_url}, concurrency {concurrency}", flush=True)
+    demo.queue(default_concurrency_limit=concurrency, max_size=args.queue_size).launch(
+        server_name="127.0.0.1", server_port=args.port, share=False, show_error=True
+    )
+
+
+if __name__ == "__main__":
+    main()
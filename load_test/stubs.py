@@ -0,0 +1,182 @@
+"""Stub backends for the load tests: nothing here talks to Ollama, OpenAI or Hugging Face."""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+REPLY: str = (
+    "A covered call pairs a long stock position with a short call. You collect the premium, "
+    "which cushions small declines, but you give up gains above the strike until expiration."
+)
+CORPUS_TOPICS: List[str] = [
+    "covered call",
+    "married put",
+    "iron condor",
+    "vertical spread",
+    "calendar spread",
+    "LEAPS",
+    "implied volatility",
+    "open interest",
+    "delta and gamma",
+    "theta decay",
+]
+
+
+def sampled_latency(latency: float, jitter: float) -> float:
+    return max(0.0, latency + random.uniform(-jitter, jitter))
+
+
+class FakeOllamaChatModel(BaseChatModel):
+    """
+    Stands in for ChatOllama: answers every prompt with REPLY after `latency` +/- `jitter`
+    seconds. At most `max_parallel` generations run at once, like an Ollama server
+    started with OLLAMA_NUM_PARALLEL; the rest wait their turn.
+    """
+
+    latency: float = 1.0
+    jitter: float = 0.0
+    max_parallel: int = 4
+    reply: str = REPLY
+    _thread_slots: Any = None
+    _async_slots: Any = None
+
+    def model_post_init(self, __context: Any) -> None:
+        self._thread_slots = threading.BoundedSemaphore(self.max_parallel)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-ollama"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _result(self) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs):
+        with self._thread_slots:
+            time.sleep(sampled_latency(self.latency, self.jitter))
+        return self._result()
+
+    async def _agenerate(
+        self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs
+    ):
+        # Created on first use so it binds to the server's event loop.
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(self.max_parallel)
+        async with self._async_slots:
+            await asyncio.sleep(sampled_latency(self.latency, self.jitter))
+        return self._result()
+
+
+def approximate_token_count(messages: List[BaseMessage]) -> int:
+    # ChatOllama counts tokens with a GPT-2 tokenizer it downloads; four characters per token is close enough here.
+    return sum(len(str(message.content)) // 4 + 1 for message in messages)
+
+
+class UnitFakeEmbedding(DeterministicFakeEmbedding):
+    """DeterministicFakeEmbedding scaled to unit length, so Chroma's relevance scores stay within [0, 1]."""
+
+    def _get_embedding(self, seed: int) -> List[float]:
+        vector = np.asarray(super()._get_embedding(seed=seed))
+        return list(vector / np.linalg.norm(vector))
+
+
+def write_corpus(directory: str, documents: int = 40, paragraphs: int = 12) -> str:
+    """Writes a synthetic options-education corpus of Markdown files and returns the directory."""
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(0)
+    for index in range(documents):
+        topic = CORPUS_TOPICS[index % len(CORPUS_TOPICS)]
+        lines = [f"# {topic.title()} ({index})"]
+        for paragraph in range(paragraphs):
+            other = rng.choice(CORPUS_TOPICS)
+            lines.append(
+                f"Section {paragraph}: a {topic} compared with a {other}. Traders weigh premium, strike, "
+                f"expiration and volatility; the maximum loss and breakeven depend on how the legs are set up."
+            )
+        with open(os.path.join(directory, f"doc_{index:03}.md"), "w", encoding="utf-8") as f:
+            f.write("\n\n".join(lines))
+    return directory
+
+
+class MockResponsesHandler(BaseHTTPRequestHandler):
+    """Answers POST .../responses like the OpenAI Responses API, after the server's configured latency."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.rstrip("/").endswith("/responses"):
+            self._send(404, {"error": {"message": f"unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+        time.sleep(sampled_latency(self.server.latency, self.server.jitter))
+        self.server.count_request()
+        self._send(200, response_body(body.get("model", "gpt-4.1-nano"), REPLY))
+
+    def _send(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def response_body(model: str, text: str) -> dict:
+    return {
+        "id": f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": model,
+        "output": [
+            {
+                "id": f"msg_{uuid.uuid4().hex}",
+                "type": "message",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {"input_tokens": 50, "output_tokens": len(text) // 4, "total_tokens": 50 + len(text) // 4},
+    }
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 1.0, jitter: float = 0.0):
+        super().__init__(("127.0.0.1", port), MockResponsesHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    def start(self) -> "MockOpenAIServer":
+        threading.Thread(target=self.serve_forever, name="mock-openai", daemon=True).start()
+        return self
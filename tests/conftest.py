@@ -0,0 +1,7 @@
+import os
+import sys
+
+WEB_SCRAPER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "web_scraper")
+
+# The web_scraper scripts import their siblings by bare module name, the way they are run.
+sys.path.insert(0, WEB_SCRAPER_DIR)
@@ -0,0 +1,48 @@
+"""Helpers shared by the test modules."""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "web_scraper", "fixtures")
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@contextmanager
+def serve_directory(directory: str) -> Iterator[str]:
+    """Serves `directory` with http.server on a free local port and yields its base URL."""
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def slow_stub(delay: float, result=None):
+    """
+    Returns a stand-in for an extractor or tool body that takes `delay` seconds and
+    then returns `result`, or `result(argument)` when it is callable.
+    """
+
+    def slow(argument=None):
+        time.sleep(delay)
+        return result(argument) if callable(result) else result
+
+    return slow
@@ -0,0 +1,128 @@
+import json
+
+import numpy as np
+import pytest
+
+from chatbot.utils.black_scholes import greeks, implied_volatility
+from chatbot.utils.tool_calls.option_greeks import DAYS_PER_YEAR, DECIMALS, get_option_greeks
+
+# Hull, "Options, Futures, and Other Derivatives", examples 15.6 (pricing) and 19.1-19.7
+# (Greeks of a call with S=49, K=50, r=5%, sigma=20%, T=20 weeks).
+HULL_19_CALL = dict(spot=49, strike=50, expiry=20 / 52, volatility=0.2, rate=0.05, is_call=True)
+# (description, inputs, {value: (expected, tolerance)}). Each tolerance is half a unit in the
+# last digit Hull prints, so a value passes exactly when it rounds to the published figure.
+REFERENCE_CASES = [
+    (
+        "Hull 15.6 call",
+        dict(spot=42, strike=40, expiry=0.5, volatility=0.2, rate=0.1, is_call=True),
+        {"price": (4.76, 0.005)},
+    ),
+    (
+        "Hull 15.6 put",
+        dict(spot=42, strike=40, expiry=0.5, volatility=0.2, rate=0.1, is_call=False),
+        {"price": (0.81, 0.005)},
+    ),
+    (
+        "Hull 19 call Greeks",
+        HULL_19_CALL,
+        {
+            "price": (2.40, 0.005),
+            "delta": (0.522, 0.0005),
+            "gamma": (0.066, 0.0005),
+            "theta": (-4.31, 0.005),
+            "vega": (12.1, 0.05),
+            "rho": (8.91, 0.005),
+        },
+    ),
+]
+RATE = 0.045
+SPOT = 100.0
+
+
+@pytest.mark.parametrize("name, inputs, expected", REFERENCE_CASES, ids=[case[0] for case in REFERENCE_CASES])
+def test_reference_values(name, inputs, expected):
+    values = greeks(**inputs)._asdict()
+    for field, (target, tolerance) in expected.items():
+        # The small slack keeps float noise from failing a value that sits exactly on a rounding edge.
+        assert abs(float(values[field]) - target) <= tolerance + 1e-12, field
+
+
+@pytest.fixture(scope="module")
+def chain():
+    rng = np.random.default_rng(7)
+    strike, expiry = np.meshgrid(np.linspace(0.5 * SPOT, 1.5 * SPOT, 60), np.linspace(7, 730, 12) / DAYS_PER_YEAR)
+    strike, expiry = strike.ravel(), expiry.ravel()
+    is_call = np.arange(strike.size) % 2 == 0
+    # A smile: out-of-the-money strikes get more volatility, plus noise.
+    volatility = 0.2 + 0.3 * np.log(strike / SPOT) ** 2 + rng.uniform(-0.02, 0.02, strike.size)
+    return strike, expiry, volatility, is_call
+
+
+def test_implied_volatility_round_trip(chain):
+    strike, expiry, volatility, is_call = chain
+    values = greeks(SPOT, strike, expiry, volatility, RATE, 0.0, is_call)
+    recovered = implied_volatility(values.price, SPOT, strike, expiry, RATE, 0.0, is_call)
+    # Deep in-the-money prices carry almost no time value, so volatility is only
+    # identifiable for contracts with a meaningful vega.
+    identifiable = values.vega > 1e-3 * SPOT
+    assert identifiable.mean() > 0.8
+    unsolved = int(np.isnan(recovered[identifiable]).sum())
+    assert unsolved == 0
+    iv_error = np.max(np.abs(recovered[identifiable] - volatility[identifiable]))
+    assert iv_error < 1e-5
+
+
+def test_put_call_parity(chain):
+    strike, expiry, volatility, _ = chain
+    parity = (
+        greeks(SPOT, strike, expiry, volatility, RATE, 0.0, True).price
+        - greeks(SPOT, strike, expiry, volatility, RATE, 0.0, False).price
+        - (SPOT - strike * np.exp(-RATE * expiry))
+    )
+    assert np.max(np.abs(parity)) < 1e-10
+
+
+def test_tool_reports_theta_per_day_and_vega_rho_per_percent():
+    rows = json.loads(
+        get_option_greeks.invoke(
+            {
+                "spot": 49,
+                "strikes": [50],
+                "days_to_expiry": [HULL_19_CALL["expiry"] * DAYS_PER_YEAR],
+                "volatility": 0.2,
+                "rate": 0.05,
+            }
+        )
+    )
+    assert len(rows) == 1
+    row = rows[0]
+    # Hull's yearly theta and per-unit vega and rho, converted with their tolerances, plus the tool's rounding.
+    reference = REFERENCE_CASES[2][2]
+    rounding = 0.5 * 10**-DECIMALS
+    for field, (target, tolerance), scale in [
+        ("theta_per_day", reference["theta"], 365),
+        ("vega_per_pct", reference["vega"], 100),
+        ("rho_per_pct", reference["rho"], 100),
+    ]:
+        assert abs(row[field] - target / scale) <= tolerance / scale + rounding + 1e-12, field
+    values = greeks(**HULL_19_CALL)
+    assert row["theta_per_day"] == round(float(values.theta) / 365, 4)
+    assert row["vega_per_pct"] == round(float(values.vega) / 100, 4)
+    assert row["rho_per_pct"] == round(float(values.rho) / 100, 4)
+
+
+def test_tool_solves_implied_volatility_from_market_prices():
+    price = float(greeks(**HULL_19_CALL).price)
+    rows = json.loads(
+        get_option_greeks.invoke(
+            {
+                "spot": 49,
+                "strikes": [50],
+                "days_to_expiry": [HULL_19_CALL["expiry"] * DAYS_PER_YEAR],
+                "market_prices": [price],
+                "rate": 0.05,
+            }
+        )
+    )
+    assert rows[0]["implied_volatility"] == 0.2
+    assert rows[0]["price"] == round(price, 4)
@@ -0,0 +1,43 @@
+import builtins
+import io
+
+import pytest
+
+from chatbot.utils import embeddings
+
+
+def cpu_with_flags(monkeypatch, machine, flags):
+    monkeypatch.setattr(embeddings.platform, "machine", lambda: machine)
+    real_open = builtins.open
+
+    def fake_open(path, *args, **kwargs):
+        if path != "/proc/cpuinfo":
+            return real_open(path, *args, **kwargs)
+        if flags is None:
+            raise FileNotFoundError(path)
+        return io.StringIO(f"processor\t: 0\nflags\t\t: fpu sse2 {flags}\n")
+
+    monkeypatch.setattr(builtins, "open", fake_open)
+
+
+@pytest.mark.parametrize(
+    "machine, flags, expected",
+    [
+        ("x86_64", "avx2 avx512f avx512_vnni", "onnx/model_qint8_avx512_vnni.onnx"),
+        ("x86_64", "avx2 avx512f", "onnx/model_qint8_avx512.onnx"),
+        ("x86_64", "avx avx2", "onnx/model_quint8_avx2.onnx"),
+        ("x86_64", None, "onnx/model_quint8_avx2.onnx"),
+        ("aarch64", None, "onnx/model_qint8_arm64.onnx"),
+        ("arm64", None, "onnx/model_qint8_arm64.onnx"),
+    ],
+)
+def test_int8_export_follows_the_cpu(monkeypatch, machine, flags, expected):
+    cpu_with_flags(monkeypatch, machine, flags)
+    assert embeddings.default_onnx_int8_file() == expected
+
+
+def test_int8_file_must_exist_rather_than_being_exported():
+    model_kwargs = embeddings._onnx_model_kwargs(0, "onnx/model_quint8_avx2.onnx")
+    assert model_kwargs["file_name"] == "onnx/model_quint8_avx2.onnx"
+    assert model_kwargs["export"] is False
+    assert "export" not in embeddings._onnx_model_kwargs(0, None)
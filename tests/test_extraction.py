@@ -0,0 +1,70 @@
+import pytest
+
+from extraction import (
+    INVESTING_CRYPTO_TABLE,
+    MARKETWATCH_HEADLINES,
+    MARKETWATCH_LATEST_NEWS,
+    MARKETWATCH_MARKET_TABLE,
+    MARKETWATCH_STORY_LINKS,
+    MarketRow,
+    extract_records,
+)
+from tests.helpers import read_fixture
+
+MARKETWATCH_SPECS = [MARKETWATCH_MARKET_TABLE, MARKETWATCH_HEADLINES, MARKETWATCH_LATEST_NEWS, MARKETWATCH_STORY_LINKS]
+# Target class names and ids in the <head>, long before the sections that use them.
+EARLY_STYLE = (
+    "<style>.css-1q67esn{border:0}.css-27mqcr{color:#666}.e1mm921i1{font-weight:700}"
+    "#primary-curated-content,#marketoverview-news{margin:0}</style>"
+)
+
+
+@pytest.mark.parametrize("spec", MARKETWATCH_SPECS, ids=lambda spec: spec.name)
+def test_marketwatch_specs_find_records(spec):
+    records = extract_records(read_fixture("marketwatch.html"), spec)
+    assert records
+    assert all(isinstance(record, spec.record) for record in records)
+
+
+def test_crypto_table():
+    records = extract_records(read_fixture("investing_crypto.html"), INVESTING_CRYPTO_TABLE)
+    assert len(records) == 100
+    assert all(record.name and record.symbol and record.price for record in records)
+
+
+@pytest.mark.parametrize("spec", MARKETWATCH_SPECS, ids=lambda spec: spec.name)
+def test_target_names_early_in_the_page(spec):
+    html = read_fixture("marketwatch.html")
+    early = html.replace("<head>", "<head>\n" + EARLY_STYLE, 1)
+    assert early.index("css-1q67esn") < html.index("css-1q67esn")
+    assert extract_records(early, spec) == extract_records(html, spec)
+
+
+def test_market_table_cells():
+    html = (
+        "<html><body><table class='x css-1q67esn'><tbody>"
+        "<tr><td></td><td>Dow</td><td>42,001.5</td><td>-12.5</td><td>-0.03%</td></tr>"
+        "<tr><td>too few cells</td></tr>"
+        "</tbody></table></body></html>"
+    )
+    assert extract_records(html, MARKETWATCH_MARKET_TABLE) == [MarketRow("Dow", "42,001.5", "-12.5", "-0.03%")]
+
+
+def test_missing_container_is_none():
+    assert extract_records("<html><body><p>maintenance</p></body></html>", MARKETWATCH_MARKET_TABLE) is None
+
+
+def test_a_scrape_parses_the_page_once(monkeypatch):
+    import extraction
+    from fetch import has_targets
+    from market_scraper import extract_headlines, extract_latest_news, extract_market_data
+
+    parses = []
+    parse = extraction.lxml.html.document_fromstring
+    monkeypatch.setattr(extraction.lxml.html, "document_fromstring", lambda html: parses.append(1) or parse(html))
+    extraction.clear_parse_cache()
+    html = read_fixture("marketwatch.html")
+    assert has_targets(html, [MARKETWATCH_MARKET_TABLE, MARKETWATCH_HEADLINES, MARKETWATCH_LATEST_NEWS])
+    for extract in (extract_market_data, extract_headlines, extract_latest_news):
+        assert not extract(html).empty
+    assert len(parses) == 1
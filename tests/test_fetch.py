@@ -0,0 +1,89 @@
+import time
+from contextlib import contextmanager
+
+from extraction import MARKETWATCH_HEADLINES, MARKETWATCH_LATEST_NEWS, MARKETWATCH_MARKET_TABLE
+from fetch import BROWSER, HTTP, fetch_http, fetch_page
+from market_scraper import extract_market_data
+from tests.helpers import FIXTURES_DIR, read_fixture, serve_directory
+
+UTF8_MARKET_TABLE = (
+    "<html><body><table class='css-1q67esn'><tbody>"
+    "<tr><td></td><td>Dow</td><td>42,001.50</td><td>−12.5</td><td>−1.2%</td></tr>"
+    "</tbody></table></body></html>"
+)
+
+
+def test_utf8_page_without_charset(tmp_path):
+    (tmp_path / "market.html").write_bytes(UTF8_MARKET_TABLE.encode("utf-8"))
+    with serve_directory(str(tmp_path)) as base_url:
+        html = fetch_http(f"{base_url}/market.html")
+    assert "−12.5" in html
+    df = extract_market_data(html)
+    assert df.loc[0, ["Price", "Change", "% Change"]].tolist() == [42001.5, -12.5, -1.2]
+
+
+def test_non_utf8_page_without_charset(tmp_path):
+    (tmp_path / "latin.html").write_bytes("<html><body><p>Café prices</p></body></html>".encode("latin-1"))
+    with serve_directory(str(tmp_path)) as base_url:
+        assert "Café prices" in fetch_http(f"{base_url}/latin.html")
+
+
+MARKETWATCH_SPECS = [MARKETWATCH_MARKET_TABLE, MARKETWATCH_HEADLINES, MARKETWATCH_LATEST_NEWS]
+WAIT_FOR = ("id", "maincontent")
+# A page whose sections are all rendered client-side: only the container is in the HTML.
+STRIPPED_PAGE = "<html><body><div id='maincontent'></div></body></html>"
+BROWSER_SECONDS = 0.3
+
+
+class FailingPool:
+    @contextmanager
+    def driver(self):
+        raise AssertionError("the browser was started for a page HTTP could serve")
+        yield
+
+
+class StubDriver:
+    """Stands in for Chrome: loading a page takes `delay` seconds and renders `page_source`."""
+
+    def __init__(self, page_source: str, delay: float):
+        self.page_source = page_source
+        self.delay = delay
+        self.visited = []
+
+    def get(self, url):
+        time.sleep(self.delay)
+        self.visited.append(url)
+
+    def find_element(self, by, value):
+        return object()
+
+
+class StubPool:
+    def __init__(self, driver: StubDriver):
+        self.stub = driver
+
+    @contextmanager
+    def driver(self):
+        yield self.stub
+
+
+def test_fixture_page_is_served_over_http():
+    with serve_directory(FIXTURES_DIR) as base_url:
+        result = fetch_page(f"{base_url}/marketwatch.html", MARKETWATCH_SPECS, WAIT_FOR, pool=FailingPool())
+    assert result.path == HTTP
+    assert result.html == read_fixture("marketwatch.html")
+
+
+def test_stripped_page_falls_back_to_the_browser(tmp_path):
+    (tmp_path / "stripped.html").write_text(STRIPPED_PAGE, encoding="utf-8")
+    stub = StubDriver(read_fixture("marketwatch.html"), BROWSER_SECONDS)
+    with serve_directory(str(tmp_path)) as base_url:
+        url = f"{base_url}/stripped.html"
+        start = time.perf_counter()
+        result = fetch_page(url, MARKETWATCH_SPECS, WAIT_FOR, settle_seconds=0, pool=StubPool(stub))
+        elapsed = time.perf_counter() - start
+    assert result.path == BROWSER
+    assert stub.visited == [url]
+    assert result.html == stub.page_source
+    # The reported time covers the HTTP attempt and the browser load.
+    assert BROWSER_SECONDS <= result.seconds <= elapsed
@@ -0,0 +1,65 @@
+import threading
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from chatbot.utils.ingest_pipeline import IngestPipeline, Source, directory_sources
+
+PAGE = "Options give the right, but not the obligation, to buy or sell. " * 20
+
+
+class RecordingCollection:
+    def __init__(self):
+        self.ids = []
+        self._lock = threading.Lock()
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        with self._lock:
+            self.ids.extend(ids)
+
+
+class RecordingStore:
+    def __init__(self):
+        self._collection = RecordingCollection()
+
+
+def write_corpus(directory, pages=3):
+    for i in range(pages):
+        (directory / f"page_{i}.txt").write_text(f"Page {i}. {PAGE}", encoding="utf-8")
+
+
+def make_pipeline(store, checkpoint_path=None):
+    return IngestPipeline(
+        store, DeterministicFakeEmbedding(size=8), chunk_size=200, embed_batch_size=4, checkpoint_path=checkpoint_path
+    )
+
+
+def test_every_chunk_is_upserted_once(tmp_path):
+    write_corpus(tmp_path)
+    store = RecordingStore()
+    stats = make_pipeline(store).run(directory_sources(str(tmp_path)))
+    assert stats["split"].items_out > 3
+    assert len(store._collection.ids) == len(set(store._collection.ids)) == stats["split"].items_out
+    assert all(stage.errors == 0 for stage in stats.values())
+
+
+def test_a_source_listed_twice_is_ingested_once(tmp_path):
+    write_corpus(tmp_path)
+    checkpoint_path = tmp_path / "done.txt"
+    sources = list(directory_sources(str(tmp_path)))
+    store = RecordingStore()
+    stats = make_pipeline(store, str(checkpoint_path)).run(sources + sources[:1])
+    assert stats["load"].items_in == len(sources)
+    assert all(stage.errors == 0 for stage in stats.values())
+    assert len(store._collection.ids) == len(set(store._collection.ids))
+    assert sorted(checkpoint_path.read_text(encoding="utf-8").split()) == sorted(s.location for s in sources)
+
+
+def test_checkpointed_sources_are_skipped(tmp_path):
+    write_corpus(tmp_path)
+    checkpoint_path = tmp_path / "done.txt"
+    sources = list(directory_sources(str(tmp_path)))
+    make_pipeline(RecordingStore(), str(checkpoint_path)).run(sources[:2])
+    store = RecordingStore()
+    stats = make_pipeline(store, str(checkpoint_path)).run(sources + [Source(sources[0].location, False)])
+    assert stats["load"].items_in == 1
+    assert len(store._collection.ids) == stats["split"].items_out > 0
@@ -0,0 +1,60 @@
+import math
+
+import pandas as pd
+import pytest
+
+from normalize import MARKET_TIMEZONE, parse_news_time, parse_numeric
+
+NEWS_TIME_CASES = [
+    # (reference, rendered time, expected wall time or None for NaT)
+    ("2026-10-19 16:00", "10:32 a.m.", "2026-10-19 10:32"),
+    ("2026-10-19 09:00", "10:32 a.m.", "2026-10-18 10:32"),
+    # 1:30 a.m. happens twice when clocks fall back, so it has no single instant.
+    ("2026-11-01 12:00", "1:30 a.m.", None),
+    # 2:30 a.m. never happens when clocks spring forward; it moves to 3:00 a.m.
+    ("2026-03-08 12:00", "2:30 a.m.", "2026-03-08 03:00"),
+    # Yesterday's times across a DST change keep their wall-clock time, not 24 hours earlier.
+    ("2026-03-08 09:00", "10:00 a.m.", "2026-03-07 10:00"),
+    ("2026-11-01 09:00", "10:00 a.m.", "2026-10-31 10:00"),
+]
+
+
+@pytest.mark.parametrize("reference, rendered, expected", NEWS_TIME_CASES)
+def test_parse_news_time(reference, rendered, expected):
+    parsed = parse_news_time(pd.Series([rendered]), pd.Timestamp(reference, tz=MARKET_TIMEZONE))[0]
+    if expected is None:
+        assert parsed is pd.NaT
+    else:
+        assert parsed == pd.Timestamp(expected, tz=MARKET_TIMEZONE)
+
+
+NUMERIC_CASES = [
+    ("1,234.56", 1234.56),
+    ("+0.52%", 0.52),
+    ("-12.3K", -12300.0),
+    ("\u22124.5", -4.5),
+    ("$1.2B", 1.2e9),
+    ("$-3", -3.0),
+    ("- 2", -2.0),
+    (" 3 ", 3.0),
+    (".5", 0.5),
+    ("1.5t", 1.5e12),
+    (7.5, 7.5),
+    ("unch", None),
+    ("", None),
+    ("N/A", None),
+    ("1.2.3", None),
+    ("1e5", None),
+    (None, None),
+]
+
+
+def test_parse_numeric():
+    values = pd.Series([value for value, _ in NUMERIC_CASES], dtype=object, index=range(10, 27), name="Change")
+    parsed = parse_numeric(values)
+    assert parsed.dtype == "float64" and parsed.name == "Change" and parsed.index.equals(values.index)
+    for (value, expected), got in zip(NUMERIC_CASES, parsed):
+        if expected is None:
+            assert math.isnan(got), value
+        else:
+            assert got == pytest.approx(expected), value
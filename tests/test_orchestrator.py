@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from orchestrator import EMPTY, FAILED, JOBS, OK, TIMEOUT, ScrapeJob, print_report, run_jobs
+from tests.helpers import FIXTURES_DIR, slow_stub
+
+TIMEOUT_SECONDS = 1.0
+# Well past the timeout; the abandoned worker finishes in the background.
+SLOW_SECONDS = 2.0
+
+
+def broken_extract(html):
+    raise ValueError("selector matched nothing usable")
+
+
+def stub_job(name: str, page: str, extract, fixture: str = "marketwatch.html") -> ScrapeJob:
+    # Jobs are grouped into pages by URL, so a URL of its own gives the stub its own worker.
+    return ScrapeJob(name, f"https://fixtures.invalid/{page}", (), ("id", "maincontent"), extract, fixture)
+
+
+def timed_run(jobs, timeout, workers=None):
+    start = time.perf_counter()
+    results = run_jobs(jobs, timeout, workers, FIXTURES_DIR)
+    return results, time.perf_counter() - start
+
+
+@pytest.fixture(scope="module")
+def mixed_run():
+    # The broken job shares the MarketWatch page with real jobs; the slow one has a page to itself.
+    broken = JOBS["market_data"]._replace(name="broken_extractor", extract=broken_extract)
+    slow = stub_job("slow_extractor", "slow", slow_stub(SLOW_SECONDS))
+    jobs = list(JOBS.values()) + [broken, slow]
+    results, wall_seconds = timed_run(jobs, TIMEOUT_SECONDS)
+    return jobs, results, wall_seconds
+
+
+def test_a_result_per_job_in_order(mixed_run):
+    jobs, results, _ = mixed_run
+    assert [result.name for result in results] == [job.name for job in jobs]
+
+
+def test_real_jobs_extract_rows_from_the_fixtures(mixed_run):
+    _, results, _ = mixed_run
+    by_name = {result.name: result for result in results}
+    assert {name: by_name[name].status for name in JOBS} == {name: OK for name in JOBS}
+    assert all(by_name[name].rows > 0 for name in JOBS)
+
+
+def test_a_raising_extractor_fails_only_its_own_job(mixed_run):
+    _, results, _ = mixed_run
+    broken = next(result for result in results if result.name == "broken_extractor")
+    assert broken.status == FAILED
+    assert "selector matched nothing usable" in broken.error
+
+
+def test_a_slow_extractor_times_out_without_holding_up_the_run(mixed_run):
+    _, results, wall_seconds = mixed_run
+    slow = next(result for result in results if result.name == "slow_extractor")
+    assert slow.status == TIMEOUT
+    assert wall_seconds < TIMEOUT_SECONDS + 0.5
+
+
+def test_the_report_has_a_row_per_job(mixed_run, capsys):
+    _, results, wall_seconds = mixed_run
+    print_report(results, wall_seconds)
+    rows = [line.split() for line in capsys.readouterr().out.splitlines()]
+    report_rows = {fields[0]: fields[1] for fields in rows if len(fields) > 1}
+    assert all(report_rows.get(result.name) == result.status for result in results)
+
+
+def test_time_queued_for_a_worker_does_not_count_against_a_page():
+    # Two pages that each fit the timeout but not back to back, on one worker.
+    fits = TIMEOUT_SECONDS * 0.6
+    queued = [stub_job(f"queued_{i}", f"queued_{i}", slow_stub(fits)) for i in range(2)]
+    results, seconds = timed_run(queued, TIMEOUT_SECONDS, workers=1)
+    assert [result.status for result in results] == [EMPTY, EMPTY]
+    assert seconds >= 2 * fits
@@ -0,0 +1,49 @@
+import asyncio
+import operator
+from typing import Annotated, List, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
+from chatbot.utils.session_memory import BoundedMemorySaver
+
+
+class EchoState(TypedDict):
+    said: Annotated[List[str], operator.add]
+
+
+def build_app(memory):
+    workflow = StateGraph(EchoState)
+    workflow.add_node("echo", lambda state: {})
+    workflow.add_edge(START, "echo")
+    workflow.add_edge("echo", END)
+    return workflow.compile(checkpointer=memory)
+
+
+def config(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_least_recently_used_threads_are_evicted():
+    memory = BoundedMemorySaver(max_threads=2)
+    app = build_app(memory)
+    app.invoke({"said": ["hi"]}, config("a"))
+    app.invoke({"said": ["hi"]}, config("b"))
+    app.invoke({"said": ["again"]}, config("a"))
+    app.invoke({"said": ["hi"]}, config("c"))
+
+    assert memory.thread_ids == ["a", "c"]
+    assert app.get_state(config("a")).values == {"said": ["hi", "again"]}
+    assert app.get_state(config("b")).values == {}
+    assert not any(key[0] == "b" for key in memory.writes)
+
+
+def test_async_runs_are_bounded_too():
+    memory = BoundedMemorySaver(max_threads=3)
+    app = build_app(memory)
+
+    async def sessions():
+        await asyncio.gather(*(app.ainvoke({"said": ["hi"]}, config(f"session-{i}")) for i in range(10)))
+
+    asyncio.run(sessions())
+    assert len(memory.thread_ids) == 3
+    assert set(memory.storage) == set(memory.thread_ids)
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from chatbot.utils.tool_node import FAILED, TIMEOUT, UNKNOWN_TOOL, ParallelToolNode
+from tests.helpers import slow_stub
+
+DELAY_SECONDS = 0.3
+TIMEOUT_SECONDS = 1.0
+# Well past the timeout; the abandoned call finishes in the background.
+HANG_SECONDS = 2.0
+CALLS = 4
+
+quote_after_delay = slow_stub(DELAY_SECONDS, lambda ticker: json.dumps({"ticker": ticker, "lastPrice": 100.0}))
+hang = slow_stub(HANG_SECONDS, "")
+
+
+@tool
+def slow_quote(ticker: str) -> str:
+    """Stub of a quote lookup that takes a fixed delay.
+
+    Args:
+        ticker (str): the ticker of a stock
+    """
+    return quote_after_delay(ticker)
+
+
+@tool
+def hung_quote(ticker: str) -> str:
+    """Stub of an upstream call that never answers in time.
+
+    Args:
+        ticker (str): the ticker of a stock
+    """
+    return hang(ticker)
+
+
+@tool
+def broken_quote(ticker: str) -> str:
+    """Stub of an upstream call that fails.
+
+    Args:
+        ticker (str): the ticker of a stock
+    """
+    raise ConnectionError(f"upstream refused {ticker}")
+
+
+def tool_calls_state(names):
+    calls = [{"name": name, "args": {"ticker": f"T{i}"}, "id": f"call_{i}"} for i, name in enumerate(names)]
+    return {"messages": [AIMessage(content="", tool_calls=calls)]}
+
+
+def run(node, state, path):
+    start = time.perf_counter()
+    result = node.invoke(state) if path == "sync" else asyncio.run(node.ainvoke(state))
+    return result["messages"], time.perf_counter() - start
+
+
+@pytest.fixture
+def node():
+    return ParallelToolNode([slow_quote, hung_quote, broken_quote], max_workers=CALLS + 2, timeout=TIMEOUT_SECONDS)
+
+
+@pytest.mark.parametrize("path", ["sync", "async"])
+def test_slow_calls_overlap(node, path):
+    state = tool_calls_state(["slow_quote"] * CALLS)
+    messages, seconds = run(node, state, path)
+    assert seconds < CALLS * DELAY_SECONDS / 2
+    assert [json.loads(m.content) for m in messages] == [{"ticker": f"T{i}", "lastPrice": 100.0} for i in range(CALLS)]
+    assert all(m.status == "success" for m in messages)
+
+
+@pytest.mark.parametrize("path", ["sync", "async"])
+def test_failing_calls_get_structured_errors(node, path):
+    state = tool_calls_state(["slow_quote", "hung_quote", "broken_quote", "no_such_tool"])
+    messages, seconds = run(node, state, path)
+
+    assert [m.tool_call_id for m in messages] == [call["id"] for call in state["messages"][0].tool_calls]
+    assert [m.status for m in messages] == ["success", "error", "error", "error"]
+    assert json.loads(messages[0].content) == {"ticker": "T0", "lastPrice": 100.0}
+    bodies = [json.loads(m.content) for m in messages[1:]]
+    assert bodies == [
+        {"error": TIMEOUT, "tool": "hung_quote", "message": f"no result within {TIMEOUT_SECONDS}s"},
+        {"error": FAILED, "tool": "broken_quote", "message": "ConnectionError: upstream refused T2"},
+        {
+            "error": UNKNOWN_TOOL,
+            "tool": "no_such_tool",
+            "message": "available tools: slow_quote, hung_quote, broken_quote",
+        },
+    ]
+    # A hung call costs the timeout, not its run time.
+    assert seconds < TIMEOUT_SECONDS + 0.5
+
+
+def test_latency_is_recorded_per_tool(node):
+    run(node, tool_calls_state(["slow_quote", "hung_quote", "broken_quote"]), "sync")
+    assert node.stats["slow_quote"].calls == 1
+    assert node.stats["broken_quote"].errors == 1
+    assert node.stats["hung_quote"].timeouts == 1
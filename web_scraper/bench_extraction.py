@@ -0,0 +1,214 @@
+# bench_extraction.py
+# Benchmarks parse + extract time of the lxml selector specs against the original
+# BeautifulSoup(html, "html.parser") code, over the synthetic HTML pages in fixtures/.
+#
+#    python bench_extraction.py --iterations 50
+
+import argparse
+import os
+import statistics
+import time
+
+from bs4 import BeautifulSoup
+import pandas as pd
+
+from extraction import (
+    INVESTING_CRYPTO_TABLE,
+    MARKETWATCH_HEADLINES,
+    MARKETWATCH_LATEST_NEWS,
+    MARKETWATCH_MARKET_TABLE,
+    MARKETWATCH_STORY_LINKS,
+    clear_parse_cache,
+    extract_records,
+    records_to_frame,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+# --- The original BeautifulSoup extraction code, kept here as the baseline ---
+def legacy_market_data(soup):
+    market_data = []
+    table = soup.find("table", class_="css-1q67esn")
+    if not table or not table.find("tbody"):
+        return pd.DataFrame()
+    for row in table.find("tbody").find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) == 5:
+            market_data.append(
+                {
+                    "Name": cells[1].text.strip(),
+                    "Price": cells[2].text.strip(),
+                    "Change": cells[3].text.strip(),
+                    "% Change": cells[4].text.strip(),
+                }
+            )
+    return pd.DataFrame(market_data)
+
+
+def legacy_headlines(soup):
+    headline_data = []
+    main_content = soup.find("div", id="primary-curated-content")
+    if not main_content:
+        return pd.DataFrame()
+    for headline in main_content.select("a[href*='/story/']"):
+        title = headline.text.strip()
+        link = headline["href"]
+        if not link.startswith("http"):
+            link = "https://www.marketwatch.com" + link
+        if title and link:
+            headline_data.append({"Headline": title, "Link": link})
+    return pd.DataFrame(headline_data).drop_duplicates()
+
+
+def legacy_story_links(soup):
+    headline_data = []
+    for headline in soup.select("a[href*='/story/']"):
+        title = headline.text.strip()
+        link = headline["href"]
+        if not link.startswith("http"):
+            link = "https://www.marketwatch.com" + link
+        if title and link:
+            headline_data.append({"Headline": title, "Link": link})
+    return pd.DataFrame(headline_data).drop_duplicates(subset=["Headline"], keep="first")
+
+
+def legacy_latest_news(soup):
+    latest_news_data = []
+    news_div = soup.find("div", id="marketoverview-news")
+    if not news_div:
+        return pd.DataFrame()
+    for item in news_div.find_all("a"):
+        try:
+            time_stamp = item.find("p", class_="css-27mqcr").text.strip()
+            title = item.find("p", class_="e1mm921i1").text.strip()
+            link = item["href"]
+            if not link.startswith("http"):
+                link = "https://www.marketwatch.com" + link
+            latest_news_data.append({"Time": time_stamp, "Headline": title, "Link": link})
+        except AttributeError:
+            continue
+    return pd.DataFrame(latest_news_data).drop_duplicates()
+
+
+def legacy_crypto(soup):
+    crypto_data = []
+    table_body = soup.find("tbody")
+    if not table_body:
+        return None
+    for row in table_body.find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) > 4:
+            crypto_data.append(
+                {"Name": cells[2].text.strip(), "Symbol": cells[3].text.strip(), "Price (USD)": cells[4].text.strip()}
+            )
+    return pd.DataFrame(crypto_data)
+
+
+def legacy_marketwatch(html):
+    soup = BeautifulSoup(html, "html.parser")
+    return [legacy_market_data(soup), legacy_headlines(soup), legacy_latest_news(soup)]
+
+
+def legacy_marketwatch_story_links(html):
+    return [legacy_story_links(BeautifulSoup(html, "html.parser"))]
+
+
+def legacy_investing(html):
+    return [legacy_crypto(BeautifulSoup(html, "html.parser"))]
+
+
+def specs_extractor(*specs):
+    def extract(html):
+        # Every timed run pays for its one parse, as a fresh scrape would.
+        clear_parse_cache()
+        return [records_to_frame(extract_records(html, spec) or [], spec) for spec in specs]
+
+    return extract
+
+
+# Emotion-style CSS for the target class names and ids at the top of the page: in the
+# fixtures they only occur in the scraped sections near the end, which real pages don't promise.
+EARLY_STYLE = (
+    "<style>.css-1q67esn{border:0}.css-27mqcr{color:#666}.e1mm921i1{font-weight:700}"
+    "#primary-curated-content,#marketoverview-news{margin:0}</style>\n"
+)
+
+
+def with_early_style(html):
+    return html.replace("<head>", "<head>\n" + EARLY_STYLE, 1)
+
+
+# (description, fixture, transform applied to the fixture or None, baseline, specs)
+CASES = [
+    (
+        "marketwatch (table + headlines + news)",
+        "marketwatch.html",
+        None,
+        legacy_marketwatch,
+        specs_extractor(MARKETWATCH_MARKET_TABLE, MARKETWATCH_HEADLINES, MARKETWATCH_LATEST_NEWS),
+    ),
+    (
+        "marketwatch, class names early in <style>",
+        "marketwatch.html",
+        with_early_style,
+        legacy_marketwatch,
+        specs_extractor(MARKETWATCH_MARKET_TABLE, MARKETWATCH_HEADLINES, MARKETWATCH_LATEST_NEWS),
+    ),
+    (
+        "marketwatch (all story links)",
+        "marketwatch.html",
+        None,
+        legacy_marketwatch_story_links,
+        specs_extractor(MARKETWATCH_STORY_LINKS),
+    ),
+    (
+        "investing.com crypto table",
+        "investing_crypto.html",
+        None,
+        legacy_investing,
+        specs_extractor(INVESTING_CRYPTO_TABLE),
+    ),
+]
+
+
+def time_it(function, html, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function(html)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def same_output(legacy_frames, spec_frames):
+    for legacy_df, spec_df in zip(legacy_frames, spec_frames):
+        if not legacy_df.reset_index(drop=True).equals(spec_df.reset_index(drop=True)):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lxml selector specs against the BeautifulSoup code.")
+    parser.add_argument("--iterations", type=int, default=20, help="timed runs per case (median is reported)")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="directory holding the fixture pages")
+    args = parser.parse_args()
+
+    print(f"{'case':<42} {'rows':>6} {'html.parser ms':>15} {'lxml specs ms':>14} {'speedup':>8}  match")
+    for name, fixture, transform, legacy, fast in CASES:
+        with open(os.path.join(args.fixtures, fixture), encoding="utf-8") as f:
+            html = f.read()
+        if transform:
+            html = transform(html)
+        legacy_frames, spec_frames = legacy(html), fast(html)
+        legacy_ms = time_it(legacy, html, args.iterations)
+        fast_ms = time_it(fast, html, args.iterations)
+        rows = sum(len(df) for df in spec_frames)
+        print(
+            f"{name:<42} {rows:>6} {legacy_ms:>15.2f} {fast_ms:>14.2f} {legacy_ms / fast_ms:>7.1f}x  "
+            f"{same_output(legacy_frames, spec_frames)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
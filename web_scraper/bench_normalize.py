@@ -0,0 +1,98 @@
+# bench_normalize.py
+# Times normalize_frame's column-wise numeric parsing against row-by-row parsing on
+# large synthetic market tables, checks both agree, and compares CSV with Parquet output.
+#
+#    python bench_normalize.py --rows 1000000
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from normalize import SUFFIXES, normalize_frame
+
+
+def synthetic_table(rows: int, seed=7) -> pd.DataFrame:
+    """A market table rendered the way the sites render it: separators, signs, percents and suffixes."""
+    rng = np.random.default_rng(seed)
+    price = rng.uniform(0.01, 90_000, rows)
+    change = rng.normal(0, 50, rows)
+    suffix = rng.choice(["", "K", "M", "B"], rows)
+    return pd.DataFrame(
+        {
+            "Name": [f"Instrument {i}" for i in range(rows)],
+            "Price": [f"{value:,.2f}" for value in price],
+            "Change": [f"{value:+,.2f}{unit}" for value, unit in zip(change, suffix)],
+            "% Change": [f"{value:+.2f}%" for value in change / price * 100],
+        }
+    )
+
+
+def parse_row_by_row(text):
+    """What every consumer had to do before: parse one string at a time."""
+    if not isinstance(text, str):
+        return float("nan")
+    text = text.strip().upper().replace(",", "").replace("%", "").replace("$", "")
+    multiplier = 1.0
+    if text and text[-1] in SUFFIXES:
+        multiplier = SUFFIXES[text[-1]]
+        text = text[:-1]
+    try:
+        return float(text) * multiplier
+    except ValueError:
+        return float("nan")
+
+
+def row_by_row(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for column in ("Price", "Change", "% Change"):
+        df[column] = [parse_row_by_row(value) for value in df[column]]
+    return df
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark normalization of scraped tables.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows in the synthetic table")
+    args = parser.parse_args()
+
+    df = synthetic_table(args.rows)
+    print(f"Synthetic table: {len(df):,} rows")
+
+    slow, slow_seconds = timed(row_by_row, df)
+    fast, fast_seconds = timed(normalize_frame, df)
+    columns = ["Price", "Change", "% Change"]
+    matches = np.allclose(slow[columns].to_numpy(), fast[columns].to_numpy(), rtol=1e-12, equal_nan=True)
+    print(f"row-by-row parse:     {slow_seconds:8.3f}s")
+    print(f"normalize_frame:      {fast_seconds:8.3f}s  ({slow_seconds / fast_seconds:.1f}x, results match: {matches})")
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "table.csv")
+        parquet_path = os.path.join(directory, "table.parquet")
+        _, csv_write = timed(fast.to_csv, csv_path)
+        _, csv_read = timed(pd.read_csv, csv_path)
+        print(
+            f"CSV:      write {csv_write:6.3f}s  read {csv_read:6.3f}s  size {os.path.getsize(csv_path) / 1e6:7.1f} MB"
+        )
+        try:
+            _, parquet_write = timed(fast.to_parquet, parquet_path)
+        except ImportError:
+            print("Parquet:  skipped, pyarrow is not installed.")
+            return
+        _, parquet_read = timed(pd.read_parquet, parquet_path)
+        print(
+            f"Parquet:  write {parquet_write:6.3f}s  read {parquet_read:6.3f}s  "
+            f"size {os.path.getsize(parquet_path) / 1e6:7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
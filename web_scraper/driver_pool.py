@@ -0,0 +1,171 @@
+# driver_pool.py
+# Shared Chrome WebDriver management for the web_scraper scripts.
+# Starting Chrome is most of the cost of a single scrape, so instead of launching
+# and quitting a browser per page we keep a small pool of stealthy headless
+# browsers alive and hand them out to the scrapers.
+
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from selenium_stealth import stealth  # Import the stealth library
+
+POOL_SIZE = 2
+MAX_PAGES_PER_DRIVER = 50
+ACQUIRE_TIMEOUT = 120
+# Bounds driver.get(); without it a page that never finishes loading holds its browser forever.
+PAGE_LOAD_TIMEOUT = 60
+
+
+@lru_cache(maxsize=1)
+def get_driver_path():
+    """Resolves the chromedriver binary once per process instead of once per scrape."""
+    return ChromeDriverManager().install()
+
+
+def build_chrome_options():
+    """Returns the headless, anti-detection ChromeOptions shared by every scraper."""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    # These options can help avoid detection
+    options.add_argument("start-maximized")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    return options
+
+
+def create_driver():
+    """Launches a new Chrome instance and applies selenium-stealth to it."""
+    service = Service(get_driver_path())
+    driver = webdriver.Chrome(service=service, options=build_chrome_options())
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    # This function modifies the browser properties to make it look like a regular user's browser.
+    stealth(
+        driver,
+        languages=["en-US", "en"],
+        vendor="Google Inc.",
+        platform="Win32",
+        webgl_vendor="Intel Inc.",
+        renderer="Intel Iris OpenGL Engine",
+        fix_hairline=True,
+    )
+    return driver
+
+
+def is_healthy(driver):
+    """Cheap liveness probe: a crashed or disconnected browser raises on any command."""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+def _quit_quietly(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class _PooledDriver:
+    """A browser together with the number of pages it has served."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+
+class DriverPool:
+    """
+    A thread-safe pool of long-lived headless Chrome browsers.
+
+    Browsers are created lazily up to `size`. A browser is recycled (quit and
+    replaced on next use) after `max_pages` pages, when it fails a health check
+    before being handed out, or when the scrape using it raises.
+    """
+
+    def __init__(self, size=POOL_SIZE, max_pages=MAX_PAGES_PER_DRIVER, driver_factory=create_driver):
+        self.size = size
+        self.max_pages = max_pages
+        self._driver_factory = driver_factory
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+        self._lock = threading.Lock()
+        self._all = set()
+        self._closed = False
+
+    def _checkout(self, timeout):
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No browser became available within {timeout} seconds.")
+        try:
+            while True:
+                try:
+                    pooled = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if is_healthy(pooled.driver):
+                    return pooled
+                print("Discarding an unhealthy browser from the pool.")
+                self._discard(pooled)
+            print("Starting a new Chrome browser for the pool...")
+            pooled = _PooledDriver(self._driver_factory())
+            with self._lock:
+                self._all.add(pooled)
+            return pooled
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _checkin(self, pooled, failed):
+        try:
+            pooled.pages += 1
+            if failed or self._closed or pooled.pages >= self.max_pages:
+                self._discard(pooled)
+            else:
+                self._idle.put(pooled)
+        finally:
+            self._slots.release()
+
+    def _discard(self, pooled):
+        with self._lock:
+            self._all.discard(pooled)
+        _quit_quietly(pooled.driver)
+
+    @contextmanager
+    def driver(self, timeout=ACQUIRE_TIMEOUT):
+        """
+        Borrows a browser for one page. Any exception raised inside the block marks
+        the browser as crashed so it is replaced rather than reused.
+        """
+        if self._closed:
+            raise RuntimeError("The driver pool has been closed.")
+        pooled = self._checkout(timeout)
+        failed = False
+        try:
+            yield pooled.driver
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._checkin(pooled, failed)
+
+    def close(self):
+        """Quits every browser owned by the pool."""
+        self._closed = True
+        with self._lock:
+            drivers = list(self._all)
+            self._all.clear()
+        for pooled in drivers:
+            _quit_quietly(pooled.driver)
+
+
+DRIVER_POOL = DriverPool()
+atexit.register(DRIVER_POOL.close)
@@ -0,0 +1,222 @@
+# extraction.py
+# Declarative, lxml-backed extraction shared by the web_scraper scripts.
+# Each site/section is described once by a selector spec, and a single code path
+# turns page source into typed records (and from there into a pandas DataFrame).
+
+import threading
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+import lxml.html
+import pandas as pd
+
+MARKETWATCH_URL = "https://www.marketwatch.com"
+# Parsed pages kept per thread; fetching checks a page's targets and then extracts from it.
+PARSE_CACHE_SIZE = 2
+
+_parsed = threading.local()
+
+
+class MarketRow(NamedTuple):
+    name: str
+    price: str
+    change: str
+    percent_change: str
+
+
+class CryptoRow(NamedTuple):
+    name: str
+    symbol: str
+    price: str
+
+
+class Headline(NamedTuple):
+    headline: str
+    link: str
+
+
+class NewsItem(NamedTuple):
+    time: str
+    headline: str
+    link: str
+
+
+class TableSpec(NamedTuple):
+    """
+    Describes a table whose rows become records.
+
+    `cells` picks the <td> indexes that feed the record fields in order, and `labels`
+    are the matching DataFrame columns.
+    """
+
+    name: str
+    container: str
+    row: str
+    record: type
+    cells: Tuple[int, ...]
+    labels: Tuple[str, ...]
+    min_cells: int
+    max_cells: Optional[int] = None
+
+
+class LinkListSpec(NamedTuple):
+    """
+    Describes a list of links whose anchors become records.
+
+    `fields` holds one XPath per text field, evaluated relative to the link (None
+    means the link's own text); the resolved href is always the record's last field.
+    `dedupe_on` names the columns used to drop duplicates (None means all columns).
+    """
+
+    name: str
+    container: str
+    link: str
+    record: type
+    fields: Tuple[Optional[str], ...]
+    labels: Tuple[str, ...]
+    base_url: str
+    dedupe_on: Optional[Tuple[str, ...]] = None
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching an element whose class list contains `name`, like bs4's class_=."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+MARKETWATCH_MARKET_TABLE = TableSpec(
+    name="marketwatch market data",
+    container=f"//table[{has_class('css-1q67esn')}]/tbody",
+    row="./tr",
+    record=MarketRow,
+    cells=(1, 2, 3, 4),
+    labels=("Name", "Price", "Change", "% Change"),
+    min_cells=5,
+    max_cells=5,
+)
+
+INVESTING_CRYPTO_TABLE = TableSpec(
+    name="investing.com crypto",
+    container="(//tbody)[1]",
+    row="./tr",
+    record=CryptoRow,
+    cells=(2, 3, 4),
+    labels=("Name", "Symbol", "Price (USD)"),
+    min_cells=5,
+)
+
+MARKETWATCH_HEADLINES = LinkListSpec(
+    name="marketwatch top headlines",
+    container="//div[@id='primary-curated-content']",
+    link=".//a[contains(@href, '/story/')]",
+    record=Headline,
+    fields=(None,),
+    labels=("Headline", "Link"),
+    base_url=MARKETWATCH_URL,
+)
+
+MARKETWATCH_STORY_LINKS = LinkListSpec(
+    name="marketwatch story links",
+    container="/*",
+    link=".//a[contains(@href, '/story/')]",
+    record=Headline,
+    fields=(None,),
+    labels=("Headline", "Link"),
+    base_url=MARKETWATCH_URL,
+    dedupe_on=("Headline",),
+)
+
+MARKETWATCH_LATEST_NEWS = LinkListSpec(
+    name="marketwatch latest news",
+    container="//div[@id='marketoverview-news']",
+    link=".//a",
+    record=NewsItem,
+    fields=(f".//p[{has_class('css-27mqcr')}]", f".//p[{has_class('e1mm921i1')}]"),
+    labels=("Time", "Headline", "Link"),
+    base_url=MARKETWATCH_URL,
+)
+
+
+def parse_page(html: str):
+    """
+    Parses the whole page with lxml, reusing the tree when the same page was parsed last.
+
+    fetch.has_targets() and every spec extracted afterwards look at the same page, so
+    a scrape parses it once. The cache is per thread because lxml trees should not be
+    shared across threads, and callers must treat the tree as read-only.
+    """
+    pages = getattr(_parsed, "pages", None)
+    if pages is None:
+        pages = _parsed.pages = OrderedDict()
+    root = pages.get(html)
+    if root is None:
+        root = pages[html] = lxml.html.document_fromstring(html)
+        while len(pages) > PARSE_CACHE_SIZE:
+            pages.popitem(last=False)
+    else:
+        pages.move_to_end(html)
+    return root
+
+
+def clear_parse_cache() -> None:
+    """Forgets this thread's parsed pages."""
+    _parsed.pages = OrderedDict()
+
+
+def _text(element) -> str:
+    return element.text_content().strip()
+
+
+def _table_records(container, spec: TableSpec) -> list:
+    records = []
+    for row in container.xpath(spec.row):
+        cells = row.xpath("./td")
+        if len(cells) < spec.min_cells or (spec.max_cells is not None and len(cells) > spec.max_cells):
+            continue
+        records.append(spec.record(*(_text(cells[index]) for index in spec.cells)))
+    return records
+
+
+def _link_records(container, spec: LinkListSpec) -> list:
+    records = []
+    for link in container.xpath(spec.link):
+        href = link.get("href")
+        if not href:
+            continue
+        if not href.startswith("http"):
+            href = spec.base_url + href
+        values = []
+        for field in spec.fields:
+            if field is None:
+                values.append(_text(link))
+                continue
+            matches = link.xpath(field)
+            values.append(_text(matches[0]) if matches else "")
+        # Links without meaningful text (icons, images, missing sub-elements) are skipped.
+        if all(values):
+            records.append(spec.record(*values, href))
+    return records
+
+
+def extract_records(html: str, spec) -> Optional[List[tuple]]:
+    """
+    Extracts typed records described by `spec` from page source.
+
+    Returns None when the spec's container is not on the page, and a (possibly
+    empty) list of `spec.record` instances otherwise.
+    """
+    root = parse_page(html)
+    containers = root.xpath(spec.container)
+    if not containers:
+        return None
+    if isinstance(spec, TableSpec):
+        return _table_records(containers[0], spec)
+    return _link_records(containers[0], spec)
+
+
+def records_to_frame(records: List[tuple], spec) -> pd.DataFrame:
+    """Builds the DataFrame the scrapers have always returned, using the spec's column labels."""
+    df = pd.DataFrame.from_records(records, columns=list(spec.labels))
+    if isinstance(spec, LinkListSpec):
+        subset = list(spec.dedupe_on) if spec.dedupe_on else None
+        df = df.drop_duplicates(subset=subset, keep="first").reset_index(drop=True)
+    return df
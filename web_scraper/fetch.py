@@ -0,0 +1,153 @@
+# fetch.py
+# HTTP-first page fetching for the web_scraper scripts.
+# A plain pooled HTTP request is tried first; when the server-rendered HTML already
+# contains what the selector specs need, no browser is started at all. Otherwise
+# the page is loaded in a pooled headless Chrome (see driver_pool.py).
+#
+# Any URL works, so the whole flow can be exercised offline against the fixture pages:
+#    python -m http.server --directory fixtures 8000
+#    fetch_page("http://127.0.0.1:8000/marketwatch.html", [MARKETWATCH_LATEST_NEWS], (By.ID, "maincontent"))
+
+import time
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from driver_pool import DRIVER_POOL
+from extraction import extract_records
+
+HTTP_TIMEOUT = 10
+HTTP_POOL_SIZE = 8
+BROWSER_WAIT_TIMEOUT = 30
+SETTLE_SECONDS = 3
+# Browser-like headers; requests already negotiates gzip/deflate and keeps connections alive.
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+HTTP = "http"
+BROWSER = "browser"
+
+
+class FetchResult(NamedTuple):
+    url: str
+    html: Optional[str]
+    path: str
+    seconds: float
+
+
+def build_session(pool_size=HTTP_POOL_SIZE):
+    """Creates a keep-alive session whose connection pool is shared by every fetch."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+
+HTTP_SESSION = build_session()
+
+
+def has_targets(html: str, specs: Sequence) -> bool:
+    """True when every spec finds its container and at least one record in the HTML."""
+    return all(extract_records(html, spec) for spec in specs)
+
+
+def fetch_http(url: str, session=None, timeout=HTTP_TIMEOUT) -> Optional[str]:
+    """Fetches the server-rendered HTML, or None when the request fails."""
+    session = session or HTTP_SESSION
+    try:
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"HTTP fetch of {url} failed: {e}")
+        return None
+    return decode_body(response)
+
+
+def decode_body(response) -> str:
+    """
+    Decodes a response's HTML. Without a charset in Content-Type requests falls back to
+    ISO-8859-1 (python -m http.server sends none), which garbles UTF-8 signs such as the
+    minus in "\u221212.5", so the bytes are tried as UTF-8 first and then as detected.
+    """
+    if "charset=" in response.headers.get("Content-Type", "").lower():
+        return response.text
+    try:
+        return response.content.decode("utf-8")
+    except UnicodeDecodeError:
+        response.encoding = response.apparent_encoding
+        return response.text
+
+
+def fetch_browser(
+    url: str,
+    wait_for: Tuple[str, str],
+    settle_seconds=SETTLE_SECONDS,
+    wait_timeout=BROWSER_WAIT_TIMEOUT,
+    error_page: Optional[str] = None,
+    pool=None,
+) -> Optional[str]:
+    """
+    Loads the page in a pooled headless browser and returns its source once the
+    `wait_for` locator is present. Returns None when the element never appears,
+    optionally saving what was rendered to `error_page` for debugging.
+    """
+    pool = pool or DRIVER_POOL
+    try:
+        with pool.driver() as driver:
+            print(f"Navigating to {url}...")
+            driver.get(url)
+            try:
+                WebDriverWait(driver, wait_timeout).until(EC.presence_of_element_located(wait_for))
+                time.sleep(settle_seconds)  # A small extra delay for late-rendering widgets
+            except Exception as e:
+                print(f"Error waiting for page elements: {e}")
+                if error_page:
+                    with open(error_page, "w", encoding="utf-8") as f:
+                        f.write(driver.page_source)
+                    print(f"Saved the page source to {error_page} for debugging.")
+                return None
+            return driver.page_source
+    except Exception as e:
+        print(f"Error driving the browser: {e}")
+        return None
+
+
+def fetch_page(
+    url: str,
+    specs: Sequence,
+    wait_for: Tuple[str, str],
+    settle_seconds=SETTLE_SECONDS,
+    error_page: Optional[str] = None,
+    session=None,
+    pool=None,
+    allow_browser=True,
+) -> FetchResult:
+    """
+    Fetches `url` over plain HTTP and falls back to the browser only when the
+    response is missing any of the `specs` targets. The result records which
+    path produced the HTML and how long the whole fetch took.
+    """
+    start = time.perf_counter()
+    html = fetch_http(url, session=session)
+    if html is not None and has_targets(html, specs):
+        result = FetchResult(url, html, HTTP, time.perf_counter() - start)
+    elif not allow_browser:
+        result = FetchResult(url, None, HTTP, time.perf_counter() - start)
+    else:
+        print("Targets not in the server-rendered HTML, falling back to the browser...")
+        html = fetch_browser(url, wait_for, settle_seconds=settle_seconds, error_page=error_page, pool=pool)
+        result = FetchResult(url, html, BROWSER, time.perf_counter() - start)
+    print(f"Fetched {url} via {result.path} in {result.seconds:.2f}s.")
+    return result
@@ -0,0 +1,85 @@
+# normalize.py
+# Typing of the scraped tables.
+# The scrapers extract text exactly as the sites render it ("1,234.56", "+0.52%",
+# "-12.3K", "10:32 a.m."); this stage turns those columns into numeric and datetime
+# dtypes, and writes the result as CSV plus Parquet.
+
+import re
+from typing import Optional
+
+import pandas as pd
+
+MARKET_TIMEZONE = "America/New_York"
+NUMERIC_COLUMNS = ("Price", "Change", "% Change", "Price (USD)")
+TIME_COLUMNS = ("Time",)
+SUFFIXES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+# One rendered number: optional currency, sign (ASCII or Unicode minus), digits with thousands
+# separators, magnitude suffix and percent sign, with whitespace allowed between the parts.
+NUMBER_PATTERN = (
+    r"^\s*\$?\s*(?P<sign>[+\-\u2212]?)\s*\$?\s*(?P<number>\d[\d,]*\.?\d*|\.\d+)\s*(?P<suffix>[KMBT]?)\s*%?\s*$"
+)
+
+
+def parse_numeric(values: pd.Series) -> pd.Series:
+    """
+    Parses a column of rendered numbers into float64.
+
+    Percentages keep their scale ("+0.52%" -> 0.52) and anything that isn't a
+    number ("unch", "", "N/A") becomes NaN.
+    """
+    parts = values.astype("string").str.extract(NUMBER_PATTERN, flags=re.IGNORECASE)
+    number = pd.to_numeric(parts["number"].str.replace(",", "", regex=False), errors="coerce")
+    sign = parts["sign"].isin(["-", "\u2212"]).map({True: -1.0, False: 1.0})
+    multiplier = parts["suffix"].str.upper().map(SUFFIXES).fillna(1.0)
+    return (sign * number * multiplier).astype("float64").rename(values.name)
+
+
+def parse_news_time(values: pd.Series, reference: Optional[pd.Timestamp] = None) -> pd.Series:
+    """
+    Parses MarketWatch ticker times into timezone-aware timestamps.
+
+    Clock-only values ("10:32 a.m.") are placed on the reference day, or the day
+    before when that would put them in the future; full dates are parsed as-is.
+    """
+    if reference is None:
+        reference = pd.Timestamp.now(tz=MARKET_TIMEZONE)
+    text = (
+        values.astype("string")
+        .str.strip()
+        .str.replace(r"\s*a\.?m\.?$", " AM", case=False, regex=True)
+        .str.replace(r"\s*p\.?m\.?$", " PM", case=False, regex=True)
+    )
+    naive = pd.to_datetime(reference.strftime("%Y-%m-%d ") + text, format="%Y-%m-%d %I:%M %p", errors="coerce")
+    # Times later than the reference are yesterday's. They move back a calendar day on the wall
+    # clock, not 24 hours, so a DST change in between does not leave them an hour off.
+    wall_clock = naive.where(naive <= reference.tz_localize(None), naive - pd.DateOffset(days=1))
+    # A wall time repeated or skipped by a DST change has no single instant; it becomes NaT or moves forward.
+    clock = wall_clock.dt.tz_localize(reference.tz, ambiguous="NaT", nonexistent="shift_forward")
+
+    dated = pd.to_datetime(text.where(naive.isna()), format="mixed", errors="coerce")
+    if dated.dt.tz is None:
+        dated = dated.dt.tz_localize(reference.tz, ambiguous="NaT", nonexistent="shift_forward")
+    return clock.fillna(dated).rename(values.name)
+
+
+def normalize_frame(df: pd.DataFrame, reference: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """Returns a copy of a scraped DataFrame with its known numeric and time columns typed."""
+    if df is None or df.empty:
+        return df
+    df = df.copy()
+    for column in NUMERIC_COLUMNS:
+        if column in df.columns:
+            df[column] = parse_numeric(df[column])
+    for column in TIME_COLUMNS:
+        if column in df.columns:
+            df[column] = parse_news_time(df[column], reference)
+    return df
+
+
+def write_outputs(df: pd.DataFrame, stem: str) -> None:
+    """Writes `stem`.csv and, when pyarrow is installed, a typed `stem`.parquet next to it."""
+    df.to_csv(f"{stem}.csv", index=False)
+    try:
+        df.to_parquet(f"{stem}.parquet", index=False)
+    except ImportError:
+        print(f"pyarrow is not installed, skipped writing {stem}.parquet.")
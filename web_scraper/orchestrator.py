@@ -0,0 +1,237 @@
+# orchestrator.py
+# One entry point that runs every registered scrape job concurrently.
+# Jobs that read the same page share a single fetch, each page is fetched on its
+# own worker thread (fetching is network/browser bound, and threads share the
+# driver pool), every job gets a timeout, and one broken site never sinks the run.
+#
+#    python orchestrator.py                        # scrape everything live
+#    python orchestrator.py --jobs crypto_table latest_news --timeout 60
+#    python orchestrator.py --fixtures fixtures    # offline, from the fixture pages
+
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import pandas as pd
+from selenium.webdriver.common.by import By
+
+from extraction import (
+    INVESTING_CRYPTO_TABLE,
+    MARKETWATCH_LATEST_NEWS,
+    MARKETWATCH_MARKET_TABLE,
+    MARKETWATCH_STORY_LINKS,
+)
+from fetch import FetchResult, fetch_page
+from market_scraper import MARKETWATCH_URL, extract_latest_news, extract_market_data
+from normalize import write_outputs
+from web_scraper import CRYPTO_URL, extract_crypto_data
+from web_scraper2 import extract_story_links
+
+DEFAULT_TIMEOUT = 90
+# How often running pages are checked against their timeout.
+POLL_SECONDS = 0.1
+FIXTURE = "fixture"
+
+OK = "ok"
+EMPTY = "empty"
+FAILED = "failed"
+TIMEOUT = "timeout"
+
+
+class ScrapeJob(NamedTuple):
+    name: str
+    url: str
+    specs: tuple
+    wait_for: Tuple[str, str]
+    extract: Callable[[str], Optional[pd.DataFrame]]
+    fixture: str
+
+
+class JobResult(NamedTuple):
+    name: str
+    url: str
+    status: str
+    fetch_path: Optional[str] = None
+    fetch_seconds: float = 0.0
+    extract_seconds: float = 0.0
+    rows: int = 0
+    error: Optional[str] = None
+    data: Optional[pd.DataFrame] = None
+
+
+JOBS: Dict[str, ScrapeJob] = {
+    job.name: job
+    for job in (
+        ScrapeJob(
+            "crypto_table",
+            CRYPTO_URL,
+            (INVESTING_CRYPTO_TABLE,),
+            (By.CSS_SELECTOR, "tbody tr"),
+            extract_crypto_data,
+            "investing_crypto.html",
+        ),
+        ScrapeJob(
+            "marketwatch_headlines",
+            MARKETWATCH_URL,
+            (MARKETWATCH_STORY_LINKS,),
+            (By.ID, "maincontent"),
+            extract_story_links,
+            "marketwatch.html",
+        ),
+        ScrapeJob(
+            "market_data",
+            MARKETWATCH_URL,
+            (MARKETWATCH_MARKET_TABLE,),
+            (By.ID, "maincontent"),
+            extract_market_data,
+            "marketwatch.html",
+        ),
+        ScrapeJob(
+            "latest_news",
+            MARKETWATCH_URL,
+            (MARKETWATCH_LATEST_NEWS,),
+            (By.ID, "maincontent"),
+            extract_latest_news,
+            "marketwatch.html",
+        ),
+    )
+}
+
+
+def fetch_for(jobs: List[ScrapeJob], fixture_dir: Optional[str]) -> FetchResult:
+    """Fetches the page shared by `jobs`, requiring every one of their specs, or reads its fixture page."""
+    first = jobs[0]
+    if fixture_dir:
+        start = time.perf_counter()
+        with open(os.path.join(fixture_dir, first.fixture), encoding="utf-8") as f:
+            html = f.read()
+        return FetchResult(first.url, html, FIXTURE, time.perf_counter() - start)
+    specs = tuple(spec for job in jobs for spec in job.specs)
+    return fetch_page(first.url, specs, first.wait_for)
+
+
+def run_page(jobs: List[ScrapeJob], fixture_dir: Optional[str] = None) -> List[JobResult]:
+    """Fetches one page and runs every job's extraction on it; errors become failed results."""
+    try:
+        fetched = fetch_for(jobs, fixture_dir)
+    except Exception as e:
+        return [JobResult(job.name, job.url, FAILED, error=f"fetch failed: {e}") for job in jobs]
+    if fetched.html is None:
+        return [
+            JobResult(job.name, job.url, FAILED, fetched.path, fetched.seconds, error="page could not be fetched")
+            for job in jobs
+        ]
+
+    results = []
+    for job in jobs:
+        start = time.perf_counter()
+        try:
+            df = job.extract(fetched.html)
+        except Exception as e:
+            results.append(
+                JobResult(
+                    job.name, job.url, FAILED, fetched.path, fetched.seconds, time.perf_counter() - start, error=str(e)
+                )
+            )
+            continue
+        rows = 0 if df is None else len(df)
+        results.append(
+            JobResult(
+                job.name,
+                job.url,
+                OK if rows else EMPTY,
+                fetched.path,
+                fetched.seconds,
+                time.perf_counter() - start,
+                rows,
+                None if rows else "no rows extracted",
+                df,
+            )
+        )
+    return results
+
+
+def run_jobs(
+    jobs: List[ScrapeJob], timeout=DEFAULT_TIMEOUT, workers: Optional[int] = None, fixture_dir: Optional[str] = None
+) -> List[JobResult]:
+    """
+    Runs `jobs` concurrently, one worker per distinct page, and returns a result per job.
+
+    Each page gets `timeout` seconds from the moment a worker starts on it, so time
+    spent queued behind other pages (when `workers` is smaller than the number of
+    pages) does not count. A page over its timeout is reported as timed out, but
+    Python cannot stop its thread: it keeps its worker until the fetch or extraction
+    returns, and the interpreter waits for it at exit. The waits a live fetch blocks
+    on are bounded (HTTP_TIMEOUT, ACQUIRE_TIMEOUT, PAGE_LOAD_TIMEOUT, BROWSER_WAIT_TIMEOUT);
+    an extractor that never returns is not.
+    """
+    pages: Dict[str, List[ScrapeJob]] = {}
+    for job in jobs:
+        pages.setdefault(job.url, []).append(job)
+
+    started: Dict[str, float] = {}
+
+    def start_page(page_jobs: List[ScrapeJob]) -> List[JobResult]:
+        started[page_jobs[0].url] = time.monotonic()
+        return run_page(page_jobs, fixture_dir)
+
+    executor = ThreadPoolExecutor(max_workers=workers or len(pages), thread_name_prefix="scrape")
+    pending = {executor.submit(start_page, page_jobs): page_jobs for page_jobs in pages.values()}
+    results: Dict[str, JobResult] = {}
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                for result in future.result():
+                    results[result.name] = result
+            now = time.monotonic()
+            for future, page_jobs in list(pending.items()):
+                began = started.get(page_jobs[0].url)
+                if began is not None and now - began >= timeout:
+                    pending.pop(future)
+                    for job in page_jobs:
+                        results[job.name] = JobResult(job.name, job.url, TIMEOUT, error=f"no result within {timeout}s")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return [results[job.name] for job in jobs]
+
+
+def print_report(results: List[JobResult], wall_seconds: float) -> None:
+    print("\n--- Scrape Timing Report ---")
+    print(f"{'job':<24} {'status':<8} {'path':<8} {'fetch s':>8} {'extract s':>10} {'rows':>6}  error")
+    for result in results:
+        print(
+            f"{result.name:<24} {result.status:<8} {result.fetch_path or '-':<8} {result.fetch_seconds:>8.2f} "
+            f"{result.extract_seconds:>10.3f} {result.rows:>6}  {result.error or ''}"
+        )
+    # Jobs that share a page share its fetch, so each page is only counted once here.
+    fetch_seconds = {result.url: result.fetch_seconds for result in results if result.fetch_path}
+    print(f"\nWall time {wall_seconds:.2f}s (the fetches alone take {sum(fetch_seconds.values()):.2f}s back to back)")
+    print("----------------------------")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run every registered scrape job concurrently.")
+    parser.add_argument("--jobs", nargs="+", choices=sorted(JOBS), default=list(JOBS), help="jobs to run")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds before a job is abandoned")
+    parser.add_argument("--workers", type=int, default=None, help="worker threads (default: one per page)")
+    parser.add_argument("--fixtures", default=None, help="read fixture pages from this directory instead")
+    parser.add_argument("--output-dir", default=".", help="where CSV/Parquet outputs are written")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_jobs([JOBS[name] for name in args.jobs], args.timeout, args.workers, args.fixtures)
+    wall_seconds = time.perf_counter() - start
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for result in results:
+        if result.status == OK:
+            write_outputs(result.data, os.path.join(args.output_dir, result.name))
+    print_report(results, wall_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# poller.py
+# Long-running polling mode for the MarketWatch scraper.
+# Each poll appends a market snapshot and only the headlines/news items that have
+# not been seen before to a SQLite database, instead of rewriting the CSV files.
+#
+#    python poller.py --interval 300 --db scraped_data.db
+
+import argparse
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from market_scraper import MARKETWATCH_URL, scrape_marketwatch_data
+
+DEFAULT_DB = "scraped_data.db"
+DEFAULT_INTERVAL = 300
+MAX_SEEN = 50_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS market_snapshots (
+    scraped_at TEXT NOT NULL,
+    name TEXT NOT NULL,
+    price,
+    change,
+    percent_change
+);
+CREATE INDEX IF NOT EXISTS market_snapshots_scraped_at ON market_snapshots (scraped_at);
+CREATE TABLE IF NOT EXISTS news_items (
+    item_hash TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    published TEXT,
+    headline TEXT NOT NULL,
+    link TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS news_items_first_seen ON news_items (first_seen);
+"""
+
+HEADLINES = "headlines"
+LATEST_NEWS = "latest_news"
+
+
+def item_hash(link: str) -> str:
+    """Stable identity of a news item; the link is unique per story on MarketWatch."""
+    return hashlib.sha1(link.encode("utf-8")).hexdigest()
+
+
+class SeenIndex:
+    """
+    A bounded, least-recently-seen set of item hashes.
+
+    It keeps memory flat no matter how long the poller runs; an item evicted from
+    the index is still deduplicated by the store's primary key, just more slowly.
+    """
+
+    def __init__(self, max_size=MAX_SEEN):
+        self.max_size = max_size
+        self._hashes = OrderedDict()
+
+    def __contains__(self, key):
+        if key in self._hashes:
+            self._hashes.move_to_end(key)
+            return True
+        return False
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def add(self, key):
+        self._hashes[key] = None
+        self._hashes.move_to_end(key)
+        while len(self._hashes) > self.max_size:
+            self._hashes.popitem(last=False)
+
+
+class ScrapeStore:
+    """Append-only SQLite storage for market snapshots and first-seen news items."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def recent_hashes(self, limit):
+        """Hashes of the most recently first-seen items, oldest first, for seeding a SeenIndex."""
+        rows = self.connection.execute(
+            "SELECT item_hash FROM news_items ORDER BY first_seen DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def append_market_snapshot(self, market_df: pd.DataFrame, scraped_at: str) -> int:
+        rows = [
+            (scraped_at, row["Name"], row["Price"], row["Change"], row["% Change"])
+            for row in market_df.to_dict("records")
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO market_snapshots (scraped_at, name, price, change, percent_change) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def insert_item(self, key, source, first_seen, published, headline, link) -> bool:
+        """Inserts a news item, returning False when it was already stored."""
+        cursor = self.connection.execute(
+            "INSERT OR IGNORE INTO news_items (item_hash, source, first_seen, published, headline, link) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, source, first_seen, published, headline, link),
+        )
+        return cursor.rowcount == 1
+
+    def close(self):
+        self.connection.close()
+
+
+def new_items(df, source, seen: SeenIndex, store: ScrapeStore, scraped_at: str) -> pd.DataFrame:
+    """Stores and returns only the rows of `df` that have never been seen before."""
+    if df is None or df.empty:
+        return pd.DataFrame()
+    fresh = []
+    keys = {}
+    with store.connection:
+        for row in df.to_dict("records"):
+            key = item_hash(row["Link"])
+            if key in seen or key in keys:
+                continue
+            keys[key] = None
+            published = row.get("Time")
+            published = None if pd.isna(published) else published.isoformat()
+            if store.insert_item(key, source, scraped_at, published, row["Headline"], row["Link"]):
+                fresh.append({"Source": source, **row})
+    # Only once the rows are committed: after a rollback they must still count as unseen.
+    for key in keys:
+        seen.add(key)
+    return pd.DataFrame(fresh)
+
+
+def poll_once(store: ScrapeStore, seen: SeenIndex, url=MARKETWATCH_URL):
+    """Scrapes once, appends the snapshot and new items, and returns (snapshot rows, new items)."""
+    market_df, headlines_df, latest_news_df = scrape_marketwatch_data(url)
+    scraped_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    snapshot_rows = 0
+    if market_df is not None and not market_df.empty:
+        snapshot_rows = store.append_market_snapshot(market_df, scraped_at)
+
+    fresh = [
+        new_items(headlines_df, HEADLINES, seen, store, scraped_at),
+        new_items(latest_news_df, LATEST_NEWS, seen, store, scraped_at),
+    ]
+    fresh = [df for df in fresh if not df.empty]
+    return snapshot_rows, pd.concat(fresh, ignore_index=True) if fresh else pd.DataFrame()
+
+
+def poll(store: ScrapeStore, seen: SeenIndex, interval=DEFAULT_INTERVAL, iterations=None, url=MARKETWATCH_URL):
+    """Polls every `interval` seconds (measured start to start) until interrupted or `iterations` runs."""
+    run = 0
+    while iterations is None or run < iterations:
+        started = time.monotonic()
+        run += 1
+        try:
+            snapshot_rows, fresh = poll_once(store, seen, url)
+        except Exception as e:
+            # A single failed poll shouldn't end a long-running session.
+            print(f"Poll {run} failed: {e}")
+        else:
+            print(f"\n--- Poll {run}: {snapshot_rows} market rows stored, {len(fresh)} new items ---")
+            if not fresh.empty:
+                pd.set_option("display.max_colwidth", None)
+                print(fresh.to_string(index=False))
+        if iterations is not None and run >= iterations:
+            break
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Continuously poll MarketWatch and append new data to SQLite.")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between polls")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite database to append to")
+    parser.add_argument("--max-seen", type=int, default=MAX_SEEN, help="item hashes kept in memory")
+    parser.add_argument("--iterations", type=int, default=None, help="stop after this many polls")
+    parser.add_argument("--url", default=MARKETWATCH_URL, help="page to scrape")
+    args = parser.parse_args()
+
+    store = ScrapeStore(args.db)
+    seen = SeenIndex(args.max_seen)
+    for key in store.recent_hashes(args.max_seen):
+        seen.add(key)
+    print(f"Loaded {len(seen)} previously seen items from {args.db}.")
+    try:
+        poll(store, seen, interval=args.interval, iterations=args.iterations, url=args.url)
+    except KeyboardInterrupt:
+        print("\nStopping the poller.")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()